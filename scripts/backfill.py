@@ -15,9 +15,12 @@ from datetime import datetime, timedelta, timezone
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from tracker.config import load_env
-from tracker.constants import DAILY_HEADERS
-from tracker.fetchers import fetch_base_repo_data
-from tracker.writers import sort_daily_raw_metrics
+from tracker.constants import DAILY_HEADERS, TIMESTAMP_FORMAT
+from tracker.fetchers import fetch_base_repo_data, fetch_pr_line_stats, group_by_date
+from tracker.pr_cache import PRStatsCache
+from tracker.repo_state import RepoState
+from tracker.retry import print_retry_stats
+from tracker.writers import coalesce_row_updates, sort_daily_raw_metrics
 
 
 def main():
@@ -26,18 +29,18 @@ def main():
     bootcamp_start = config.get("bootcamp_start_date", "2026-02-23")
     bootcamp_iso = f"{bootcamp_start}T00:00:00Z"
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
 
     print(f"Backfilling {len(learners)} learners from {bootcamp_start} to {today}")
 
-    # Ensure headers
+    # Load existing rows, then ensure headers from the same read
     ws = sheets.get_worksheet("Daily Raw Metrics")
-    existing = ws.row_values(1) if ws.row_count > 0 else []
-    if not existing or existing[0] != "Username":
+    all_existing = ws.get_all_values()
+    if not all_existing or not all_existing[0] or all_existing[0][0] != "Username":
         ws.update(values=[DAILY_HEADERS], range_name="A1")
+        all_existing = [DAILY_HEADERS] + all_existing[1:]
 
-    # Load existing rows — skip only rows that have real activity data
-    all_existing = ws.get_all_values()
+    # Skip only rows that have real activity data
     existing_keys = set()
     existing_row_map = {}  # (username, date) -> row number for updates
     for i, row in enumerate(all_existing[1:], start=2):
@@ -55,12 +58,15 @@ def main():
 
     # Fetch base repo data once (PRs, issues, comments, review comments)
     base_repo_data = fetch_base_repo_data(
-        gh, base_repos, since=bootcamp_iso, include_review_comments=True
+        gh, base_repos, since=bootcamp_iso, include_review_comments=True,
+        repo_state=RepoState(),
     )
 
+    pr_cache = PRStatsCache()
     all_rows = []
     for idx, learner in enumerate(learners, 1):
         username = learner["username"]
+        uname_lower = username.lower()
         fork_owner, fork_repo = learner["fork_repo"].split("/")
         base_owner, base_repo_name = learner["base_repo"].split("/")
 
@@ -82,88 +88,76 @@ def main():
                 commits_by_date.setdefault(d, []).append(c)
 
         # Get user's PRs and issues from base repo data
-        repo_data = base_repo_data.get(
-            learner["base_repo"],
-            {"prs": [], "issues": [], "comments": [], "review_comments": []},
-        )
+        repo_data = base_repo_data.get(learner["base_repo"], {})
         user_prs = [
-            p for p in repo_data["prs"]
-            if p["user"]["login"].lower() == username.lower()
-            and p["created_at"][:10] >= bootcamp_start
+            p for p in repo_data.get("prs_by_user", {}).get(uname_lower, [])
+            if p["_created_date"] >= bootcamp_start
         ]
         user_issues = [
-            i for i in repo_data["issues"]
-            if i["user"]["login"].lower() == username.lower()
-            and i["created_at"][:10] >= bootcamp_start
+            i for i in repo_data.get("issues_by_user", {}).get(uname_lower, [])
+            if i["_created_date"] >= bootcamp_start
         ]
-        all_comments = repo_data.get("comments", [])
-        all_review_comments = repo_data.get("review_comments", [])
+        user_comments = repo_data.get("comments_by_user", {}).get(uname_lower, [])
+        user_review_comments = repo_data.get("review_comments_by_user", {}).get(uname_lower, [])
+
+        # Bucket by date once so each day below is a dict lookup
+        prs_by_created = group_by_date(user_prs, "_created_date")
+        prs_by_merged = group_by_date(user_prs, "_merged_date")
+        prs_by_closed = group_by_date(
+            [p for p in user_prs if p["state"] == "closed"], "_closed_date"
+        )
+        issues_by_created = group_by_date(user_issues)
+        comments_by_created = group_by_date(user_comments)
+        review_comments_by_created = group_by_date(user_review_comments)
 
         # Fetch PR line stats once per PR, group by creation date
         pr_lines_by_date = {}
+        pr_details = fetch_pr_line_stats(
+            gh, base_owner, base_repo_name, user_prs, pr_cache=pr_cache
+        )
         for pr in user_prs:
-            d = pr["created_at"][:10]
-            try:
-                detail = gh.get_pr_detail(base_owner, base_repo_name, pr["number"])
-                pr_lines_by_date.setdefault(d, [0, 0])
-                pr_lines_by_date[d][0] += detail.get("additions", 0)
-                pr_lines_by_date[d][1] += detail.get("deletions", 0)
-            except Exception:
-                pass
+            detail = pr_details.get(pr["number"])
+            if detail is None:
+                continue
+            d = pr["_created_date"]
+            pr_lines_by_date.setdefault(d, [0, 0])
+            pr_lines_by_date[d][0] += detail.get("additions", 0)
+            pr_lines_by_date[d][1] += detail.get("deletions", 0)
 
         # Collect all dates with any activity
         active_dates = set(commits_by_date.keys())
         for p in user_prs:
-            active_dates.add(p["created_at"][:10])
-            if p.get("merged_at"):
-                active_dates.add(p["merged_at"][:10])
+            active_dates.add(p["_created_date"])
+            if p["_merged_date"]:
+                active_dates.add(p["_merged_date"])
         for i in user_issues:
-            active_dates.add(i["created_at"][:10])
-        for c in all_comments:
-            if c["user"]["login"].lower() == username.lower() and c["created_at"][:10] >= bootcamp_start:
-                active_dates.add(c["created_at"][:10])
-        for c in all_review_comments:
-            if c["user"]["login"].lower() == username.lower() and c["created_at"][:10] >= bootcamp_start:
-                active_dates.add(c["created_at"][:10])
+            active_dates.add(i["_created_date"])
+        active_dates.update(comments_by_created)
+        active_dates.update(review_comments_by_created)
 
         learner_count = 0
         for date_str in sorted(active_dates):
             if date_str < bootcamp_start or date_str > today:
                 continue
-            if (username.lower(), date_str) in existing_keys:
+            if (uname_lower, date_str) in existing_keys:
                 continue
 
             commits = commits_by_date.get(date_str, [])
-            prs_opened = len([p for p in user_prs if p["created_at"][:10] == date_str])
-            merged_prs = [p for p in user_prs if p.get("merged_at") and p["merged_at"][:10] == date_str]
+            prs_opened = len(prs_by_created.get(date_str, []))
+            merged_prs = prs_by_merged.get(date_str, [])
             prs_merged = len(merged_prs)
 
-            issues_opened = len([i for i in user_issues if i["created_at"][:10] == date_str])
+            issues_opened = len(issues_by_created.get(date_str, []))
 
-            issue_comments = len([
-                c for c in all_comments
-                if c["user"]["login"].lower() == username.lower()
-                and c["created_at"][:10] == date_str
-            ])
-            review_comments = len([
-                c for c in all_review_comments
-                if c["user"]["login"].lower() == username.lower()
-                and c["created_at"][:10] == date_str
-            ])
+            issue_comments = len(comments_by_created.get(date_str, []))
+            review_comments = len(review_comments_by_created.get(date_str, []))
 
             lines = pr_lines_by_date.get(date_str, [0, 0])
 
-            merge_times = []
-            for pr in merged_prs:
-                created = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-                merged = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
-                merge_times.append((merged - created).total_seconds() / 3600)
+            merge_times = [pr["_merge_hours"] for pr in merged_prs]
             avg_mt = round(sum(merge_times) / len(merge_times), 1) if merge_times else 0
 
-            closed_prs = [
-                p for p in user_prs
-                if p["state"] == "closed" and p.get("closed_at", "")[:10] == date_str
-            ]
+            closed_prs = prs_by_closed.get(date_str, [])
             rejected = [p for p in closed_prs if not p.get("merged_at")]
             rej_rate = round(len(rejected) / len(closed_prs), 2) if closed_prs else 0
 
@@ -185,7 +179,7 @@ def main():
     if all_rows:
         next_row = len(all_existing) + 1
         new_row_count = 0
-        updates = []
+        row_writes = {}
         for row_data in all_rows:
             key = (row_data[0].lower(), row_data[1])
             if key in existing_row_map:
@@ -195,18 +189,18 @@ def main():
                 r = next_row
                 next_row += 1
                 new_row_count += 1
-            updates.append({"range": f"A{r}:M{r}", "values": [row_data]})
+            row_writes[r] = row_data
 
         if next_row - 1 > ws.row_count:
             ws.add_rows(next_row - 1 - ws.row_count)
             print(f"  Expanded sheet to {next_row - 1} rows")
 
-        chunk_size = 200
-        for i in range(0, len(updates), chunk_size):
-            ws.batch_update(updates[i:i + chunk_size])
-            print(f"  Written {min(i + chunk_size, len(updates))}/{len(updates)}")
+        # New rows are consecutive, so they collapse into one contiguous range.
+        sheets.batch_update(ws, coalesce_row_updates(row_writes, "M"))
+        print(f"  Wrote {len(row_writes)} rows")
 
-    sort_daily_raw_metrics(ws)
+    sort_daily_raw_metrics(ws, sheets=sheets)
+    print_retry_stats()
     print(f"\nBackfill complete. {len(all_rows)} new rows added.")
 
 
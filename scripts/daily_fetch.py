@@ -12,9 +12,16 @@ from datetime import datetime, timedelta, timezone
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from tracker.commit_state import CommitState
+from tracker.commit_stats_cache import CommitStatsCache
 from tracker.config import load_env
 from tracker.constants import DAILY_HEADERS
+from tracker.fetchers import fetch_base_repo_data
 from tracker.formatting import setup_sheet_structure, ensure_config_defaults, format_sheets, protect_sheets
+from tracker.pr_cache import PRStatsCache
+from tracker.repo_state import RepoState
+from tracker.retry import print_retry_stats
+from tracker.scoring import bootcamp_start_date
 from tracker.writers import (
     write_daily_metrics,
     sort_daily_raw_metrics,
@@ -23,6 +30,7 @@ from tracker.writers import (
     write_daily_view,
     write_alerts,
     write_external_sheet,
+    learner_workers,
 )
 
 fetch_day = write_daily_metrics
@@ -39,18 +47,30 @@ def main():
     ensure_config_defaults(sheets)
 
     ws = sheets.get_worksheet("Daily Raw Metrics")
-    existing = ws.row_values(1) if ws.row_count > 0 else []
-    if not existing or existing[0] != "Username":
-        ws.update(values=[DAILY_HEADERS], range_name="A1")
+    sheets.ensure_headers(ws, DAILY_HEADERS)
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
 
-    # Re-process yesterday to catch activity that happened after yesterday's run
-    write_daily_metrics(gh, sheets, ws, learners, base_repos, yesterday)
-    write_daily_metrics(gh, sheets, ws, learners, base_repos, today)
+    # One base repo fetch (since bootcamp start, or yesterday if later) serves
+    # both daily passes and the leaderboard; the daily metrics filter by date.
+    bootcamp_iso = f"{bootcamp_start_date(config).isoformat()}T00:00:00Z"
+    base_repo_data = fetch_base_repo_data(
+        gh, base_repos, since=min(bootcamp_iso, f"{yesterday}T00:00:00Z"),
+        include_review_comments=True, repo_state=RepoState(),
+    )
+
+    # Re-process yesterday to catch activity that happened after yesterday's run.
+    workers = learner_workers(config)
+    stats_cache = CommitStatsCache()
+    write_daily_metrics(gh, sheets, ws, learners, base_repos, yesterday,
+                        base_repo_data=base_repo_data, workers=workers, stats_cache=stats_cache)
+    write_daily_metrics(gh, sheets, ws, learners, base_repos, today,
+                        base_repo_data=base_repo_data, workers=workers, stats_cache=stats_cache)
 
-    sort_daily_raw_metrics(ws)
+    # The sorted contents are reused by the Daily View, Alerts, and external
+    # sheet writers below instead of each re-reading the whole tab.
+    raw_data = sort_daily_raw_metrics(ws, read_back=True, sheets=sheets)
 
     today_dt = datetime.now(timezone.utc).date()
 
@@ -75,24 +95,27 @@ def main():
 
     # All-time + period leaderboards computed from the same API data (no extra calls)
     leaderboard_rows, period_rows = update_leaderboard(
-        gh, sheets, learners, base_repos, config, periods=periods
+        gh, sheets, learners, base_repos, config, periods=periods,
+        commit_state=CommitState(), base_repo_data=base_repo_data,
+        pr_cache=PRStatsCache(),
     )
 
     weekly_rows = period_rows.get("Weekly Leaderboard", [])
     monthly_rows = period_rows.get("Monthly Leaderboard", [])
 
-    write_daily_view(sheets, ws)
+    write_daily_view(sheets, ws, raw_data=raw_data)
 
     write_summary(sheets, leaderboard_rows)
 
-    write_alerts(sheets, leaderboard_rows, ws, config)
+    write_alerts(sheets, leaderboard_rows, ws, config, raw_data=raw_data)
 
     write_external_sheet(sheets, leaderboard_rows, ws, config,
-                         weekly_rows=weekly_rows, monthly_rows=monthly_rows)
+                         weekly_rows=weekly_rows, monthly_rows=monthly_rows, raw_data=raw_data)
 
-    format_sheets(sheets)
+    format_sheets(sheets, config)
     protect_sheets(sheets)
 
+    print_retry_stats()
     print("\nDaily fetch complete.")
 
 
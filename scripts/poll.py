@@ -8,13 +8,16 @@ poll timestamp in Config.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from tracker.config import load_env
-from tracker.constants import DAILY_HEADERS
-from tracker.writers import sort_daily_raw_metrics
+from tracker.constants import DAILY_HEADERS, TIMESTAMP_FORMAT
+from tracker.fetchers import fetch_base_repo_data
+from tracker.retry import print_retry_stats
+from tracker.writers import learner_workers, sort_daily_raw_metrics, upsert_daily_rows
 
 
 def main():
@@ -28,53 +31,51 @@ def main():
     print(f"Tracking {len(learners)} learners across {len(base_repos)} repos")
 
     ws = sheets.get_worksheet("Daily Raw Metrics")
-    existing = ws.row_values(1) if ws.row_count > 0 else []
-    if not existing or existing[0] != "Username":
-        ws.update(values=[DAILY_HEADERS], range_name="A1")
+    sheets.ensure_headers(ws, DAILY_HEADERS)
 
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
 
-    base_repo_data = {}
-    for repo_full in base_repos:
-        base_owner, base_repo = repo_full.split("/")
-        print(f"  Fetching base repo data: {repo_full}...")
-        try:
-            prs = gh.get_pull_requests(base_owner, base_repo, state="all")
-        except Exception:
-            prs = []
-        try:
-            issues = gh.get_issues(base_owner, base_repo)
-        except Exception:
-            issues = []
+    # Base repo endpoints are fetched concurrently; PRs and comments only
+    # back to the last poll, since older ones cannot count towards it.
+    base_repo_data = fetch_base_repo_data(gh, base_repos, since=last_poll)
+
+    def poll_commits(learner):
+        """Fetch the learner's fork commits since the last poll."""
+        fork_owner, fork_repo = learner["fork_repo"].split("/")
+        uname_lower = learner["username"].lower()
         try:
-            comments = gh.get_issue_comments(base_owner, base_repo, since=last_poll)
+            commits = gh.get_commits(
+                fork_owner, fork_repo, since=last_poll, author=learner["username"]
+            )
         except Exception:
-            comments = []
-        base_repo_data[repo_full] = {"prs": prs, "issues": issues, "comments": comments}
+            return []
+        return [
+            c for c in commits
+            if c.get("author") and c["author"].get("login", "").lower() == uname_lower
+        ]
+
+    workers = max(1, min(learner_workers(config), len(learners)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        learner_commits = list(executor.map(poll_commits, learners))
 
     all_rows = []
-    for learner in learners:
+    for learner, commits in zip(learners, learner_commits):
         username = learner["username"]
-        fork_owner, fork_repo = learner["fork_repo"].split("/")
-
-        try:
-            commits = gh.get_commits(fork_owner, fork_repo, since=last_poll)
-            commits = [c for c in commits if c.get("author") and c["author"].get("login", "").lower() == username.lower()]
-        except Exception:
-            commits = []
+        uname_lower = username.lower()
 
         commit_count = len(commits)
 
-        data = base_repo_data.get(learner["base_repo"], {"prs": [], "issues": [], "comments": []})
-        user_prs = [p for p in data["prs"] if p["user"]["login"].lower() == username.lower()]
+        # Per-author indexes from fetch_base_repo_data: one dict hit per learner.
+        data = base_repo_data.get(learner["base_repo"], {})
+        user_prs = data.get("prs_by_user", {}).get(uname_lower, [])
         prs_opened = len([p for p in user_prs if p["created_at"] >= last_poll])
         prs_merged = len([p for p in user_prs if p.get("merged_at") and p["merged_at"] >= last_poll])
 
-        user_issues = [i for i in data["issues"] if i["user"]["login"].lower() == username.lower()]
+        user_issues = data.get("issues_by_user", {}).get(uname_lower, [])
         issues_opened = len([i for i in user_issues if i["created_at"] >= last_poll])
 
-        issue_comments = len([c for c in data["comments"] if c["user"]["login"].lower() == username.lower()])
+        issue_comments = len(data.get("comments_by_user", {}).get(uname_lower, []))
 
         has_activity = any([commit_count, prs_opened, prs_merged, issues_opened, issue_comments])
         if not has_activity:
@@ -89,38 +90,14 @@ def main():
         print(f"  {username}: {commit_count} commits, {prs_opened} PRs, {issues_opened} issues")
 
     if all_rows:
-        existing_data = ws.get_all_values()
-        existing_map = {}
-        for i, row in enumerate(existing_data[1:], start=2):
-            if len(row) >= 2:
-                existing_map[(row[0].lower(), row[1])] = i
-
-        updates = []
-        next_row = len(existing_data) + 1
-        for row_data in all_rows:
-            key = (row_data[0].lower(), row_data[1])
-            if key in existing_map:
-                r = existing_map[key]
-            else:
-                r = next_row
-                next_row += 1
-            updates.append({"range": f"A{r}:M{r}", "values": [row_data]})
-
-        if next_row - 1 > ws.row_count:
-            ws.add_rows(next_row - 1 - ws.row_count)
-
-        ws.batch_update(updates)
-        print(f"  Wrote {len(updates)} rows")
-
-    sort_daily_raw_metrics(ws)
-
-    config_ws = sheets.get_worksheet("Config")
-    all_config = config_ws.get_all_values()
-    for i, row in enumerate(all_config):
-        if row and row[0].strip() == "last_poll_timestamp":
-            config_ws.update_cell(i + 1, 2, now)
-            break
+        updated, added = upsert_daily_rows(sheets, ws, all_rows)
+        print(f"  Wrote {updated} updated and {added} new rows")
+
+    sort_daily_raw_metrics(ws, sheets=sheets)
+
+    sheets.update_config("last_poll_timestamp", now)
 
+    print_retry_stats()
     print("Poll complete.")
 
 
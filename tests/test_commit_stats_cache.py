@@ -0,0 +1,56 @@
+"""Tests for the on-disk commit line stats cache."""
+
+import os
+import tempfile
+import unittest
+
+from tracker.commit_stats_cache import CommitStatsCache
+
+
+class CommitStatsCacheTest(unittest.TestCase):
+    """CommitStatsCache stores stats per (repo, sha) across instances."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "nested", "commit_stats.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_survives_reopen(self):
+        cache = CommitStatsCache(self.path)
+        cache.put_many("u/fork", {
+            "a1": {"additions": 10, "deletions": 2},
+            "b2": {"additions": 0, "deletions": 7},
+        })
+        cache._conn.close()
+
+        reopened = CommitStatsCache(self.path)
+        self.assertEqual(reopened.get_many("u/fork", ["a1", "b2", "c3"]), {
+            "a1": {"additions": 10, "deletions": 2},
+            "b2": {"additions": 0, "deletions": 7},
+        })
+        reopened._conn.close()
+
+    def test_entries_are_scoped_by_repo(self):
+        cache = CommitStatsCache(self.path)
+        cache.put_many("u/fork", {"a1": {"additions": 1, "deletions": 1}})
+        self.assertEqual(cache.get_many("v/fork", ["a1"]), {})
+        cache._conn.close()
+
+    def test_lookups_larger_than_one_query_chunk(self):
+        cache = CommitStatsCache(self.path)
+        stats = {f"sha{i}": {"additions": i, "deletions": 0} for i in range(1200)}
+        cache.put_many("u/fork", stats)
+        self.assertEqual(cache.get_many("u/fork", list(stats)), stats)
+        cache._conn.close()
+
+    def test_empty_inputs(self):
+        cache = CommitStatsCache(self.path)
+        cache.put_many("u/fork", {})
+        self.assertEqual(cache.get_many("u/fork", []), {})
+        cache._conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
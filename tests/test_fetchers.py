@@ -0,0 +1,137 @@
+"""Tests for the incremental base repo fetch in tracker.fetchers."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from tracker.constants import TIMESTAMP_FORMAT
+from tracker.fetchers import FULL_RESCAN_DAYS, _fetch_repo_items, fetch_pr_line_stats
+from tracker.repo_state import RepoState
+
+KEY = "o/r:comments"
+BOUND = "2026-02-23T00:00:00Z"
+
+
+def iso(dt):
+    """Format a datetime the way RepoState stores timestamps."""
+    return dt.strftime(TIMESTAMP_FORMAT)
+
+
+class RecordingFetch:
+    """Endpoint stand-in that returns canned items and records each since."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+
+    def __call__(self, since=None):
+        self.calls.append(since)
+        return self.items
+
+
+class FetchRepoItemsTest(unittest.TestCase):
+    """_fetch_repo_items does full fetches or merges deltas by id."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state = RepoState(os.path.join(self.tmp.name, "repo_state.sqlite"))
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.state._conn.close()
+        self.tmp.cleanup()
+
+    def test_without_state_fetches_directly(self):
+        fetch = RecordingFetch([{"id": 1}])
+        self.assertEqual(_fetch_repo_items(None, KEY, fetch, BOUND), [{"id": 1}])
+        self.assertEqual(fetch.calls, [BOUND])
+
+    def test_first_fetch_is_full_and_stored(self):
+        fetch = RecordingFetch([{"id": 1, "body": "a"}])
+        items = _fetch_repo_items(self.state, KEY, fetch, BOUND)
+
+        self.assertEqual(items, [{"id": 1, "body": "a"}])
+        self.assertEqual(fetch.calls, [BOUND])
+        entry = self.state.get(KEY)
+        self.assertEqual(entry["since"], BOUND)
+        self.assertEqual(entry["items"], items)
+
+    def test_delta_merges_by_id_with_newer_copies_winning(self):
+        fetched_at = self.now - timedelta(hours=12)
+        self.state.put(KEY, BOUND, iso(self.now - timedelta(days=1)), iso(fetched_at), [
+            {"id": 1, "body": "old"},
+            {"id": 2, "body": "kept"},
+        ])
+        fetch = RecordingFetch([{"id": 1, "body": "edited"}, {"id": 3, "body": "new"}])
+
+        items = _fetch_repo_items(self.state, KEY, fetch, BOUND)
+
+        # The delta starts one overlap day before the previous fetch.
+        self.assertEqual(fetch.calls, [iso(fetched_at - timedelta(days=1))])
+        self.assertEqual(sorted(items, key=lambda i: i["id"]), [
+            {"id": 1, "body": "edited"},
+            {"id": 2, "body": "kept"},
+            {"id": 3, "body": "new"},
+        ])
+        self.assertEqual(len(self.state.get(KEY)["items"]), 3)
+
+    def test_delta_never_reaches_before_the_lower_bound(self):
+        self.state.put(KEY, BOUND, iso(self.now), "2026-02-23T06:00:00Z", [])
+        fetch = RecordingFetch([])
+        _fetch_repo_items(self.state, KEY, fetch, BOUND)
+        self.assertEqual(fetch.calls, [BOUND])
+
+    def test_changed_bound_forces_full_fetch(self):
+        self.state.put(KEY, "2026-01-01T00:00:00Z", iso(self.now), iso(self.now), [{"id": 9}])
+        fetch = RecordingFetch([{"id": 1}])
+
+        items = _fetch_repo_items(self.state, KEY, fetch, BOUND)
+
+        self.assertEqual(items, [{"id": 1}])
+        self.assertEqual(fetch.calls, [BOUND])
+
+    def test_stale_full_fetch_is_redone(self):
+        stale = iso(self.now - timedelta(days=FULL_RESCAN_DAYS + 1))
+        self.state.put(KEY, BOUND, stale, iso(self.now), [{"id": 9}])
+        fetch = RecordingFetch([{"id": 1}])
+
+        self.assertEqual(_fetch_repo_items(self.state, KEY, fetch, BOUND), [{"id": 1}])
+        self.assertEqual(fetch.calls, [BOUND])
+        self.assertNotEqual(self.state.get(KEY)["full_at"], stale)
+
+
+class PartialGitHub:
+    """GitHubClient stand-in whose GraphQL lookup resolves only some PRs."""
+
+    def __init__(self, resolved):
+        self.resolved = resolved
+        self.rest_calls = []
+
+    def get_pr_details_bulk(self, owner, repo, pr_numbers):
+        return {n: {"additions": n, "deletions": 0} for n in pr_numbers if n in self.resolved}
+
+    def get_pr_details_many(self, owner, repo, pr_numbers):
+        self.rest_calls.append(pr_numbers)
+        return {n: {"additions": 10 * n, "deletions": 1} for n in pr_numbers}
+
+
+class FetchPRLineStatsTest(unittest.TestCase):
+    """fetch_pr_line_stats falls back to REST for PRs GraphQL did not resolve."""
+
+    def test_unresolved_prs_are_fetched_over_rest(self):
+        gh = PartialGitHub(resolved={1, 3})
+        prs = [{"number": n, "updated_at": "2026-03-01T00:00:00Z"} for n in (1, 2, 3)]
+
+        stats = fetch_pr_line_stats(gh, "o", "r", prs)
+
+        self.assertEqual(gh.rest_calls, [[2]])
+        self.assertEqual(stats, {
+            1: {"additions": 1, "deletions": 0},
+            2: {"additions": 20, "deletions": 1},
+            3: {"additions": 3, "deletions": 0},
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
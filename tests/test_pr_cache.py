@@ -0,0 +1,46 @@
+"""Tests for the on-disk PR line stats cache."""
+
+import os
+import tempfile
+import unittest
+
+from tracker.pr_cache import PRStatsCache
+
+
+def pr(number, updated_at="2026-03-01T00:00:00Z"):
+    """Build a minimal PR dict as returned by the GitHub API."""
+    return {"number": number, "updated_at": updated_at}
+
+
+class PRStatsCacheTest(unittest.TestCase):
+    """PRStatsCache serves PRs whose updated_at matches the cached entry."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = PRStatsCache(os.path.join(self.tmp.name, "pr_stats.sqlite"))
+
+    def tearDown(self):
+        self.cache._conn.close()
+        self.tmp.cleanup()
+
+    def test_only_unchanged_prs_are_hits(self):
+        self.cache.put_many("o/r", [pr(1), pr(2)], {
+            1: {"additions": 5, "deletions": 1},
+            2: {"additions": 7, "deletions": 0},
+        })
+        hits = self.cache.get_many("o/r", [pr(1), pr(2, "2026-03-02T00:00:00Z"), pr(3)])
+        self.assertEqual(hits, {1: {"additions": 5, "deletions": 1}})
+
+    def test_entries_are_scoped_by_repo(self):
+        self.cache.put_many("o/r", [pr(1)], {1: {"additions": 5, "deletions": 1}})
+        self.assertEqual(self.cache.get_many("o/other", [pr(1)]), {})
+
+    def test_lookups_larger_than_one_query_chunk(self):
+        prs = [pr(n) for n in range(1, 1201)]
+        stats = {n: {"additions": n, "deletions": 0} for n in range(1, 1201)}
+        self.cache.put_many("o/r", prs, stats)
+        self.assertEqual(self.cache.get_many("o/r", prs), stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
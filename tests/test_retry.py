@@ -0,0 +1,37 @@
+"""Tests for the retry policy in tracker.retry."""
+
+import unittest
+
+import requests
+
+from tracker.retry import _retry_delay
+
+
+def http_error(status):
+    """Build a requests.HTTPError carrying a response with the given status."""
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = b""
+    return requests.HTTPError(response=resp)
+
+
+class RetryDelayTest(unittest.TestCase):
+    """Non-idempotent calls retry rate limits but not timeouts or 5xx."""
+
+    def test_transient_errors_retry_by_default(self):
+        self.assertIsNotNone(_retry_delay(http_error(503), 0, 1.0))
+        self.assertIsNotNone(_retry_delay(requests.Timeout(), 0, 1.0))
+
+    def test_rate_limits_only_skips_transient_errors(self):
+        self.assertIsNone(_retry_delay(http_error(503), 0, 1.0, rate_limits_only=True))
+        self.assertIsNone(_retry_delay(requests.Timeout(), 0, 1.0, rate_limits_only=True))
+
+    def test_rate_limits_only_still_retries_429(self):
+        self.assertIsNotNone(_retry_delay(http_error(429), 0, 1.0, rate_limits_only=True))
+
+    def test_client_errors_never_retry(self):
+        self.assertIsNone(_retry_delay(http_error(400), 0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
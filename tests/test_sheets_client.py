@@ -0,0 +1,32 @@
+"""Tests for which Sheets requests the retrying transport may repeat."""
+
+import unittest
+
+from tracker.sheets_client import _is_idempotent
+
+BASE = "https://sheets.googleapis.com/v4/spreadsheets/abc"
+
+
+class IsIdempotentTest(unittest.TestCase):
+    """Appends and addSheet are retried on rate limits only."""
+
+    def test_reads_and_updates_are_idempotent(self):
+        self.assertTrue(_is_idempotent(f"{BASE}/values/Sheet1!A1:B", None))
+        self.assertTrue(_is_idempotent(f"{BASE}/values:batchUpdate", {"data": []}))
+        self.assertTrue(_is_idempotent(
+            f"{BASE}:batchUpdate", {"requests": [{"sortRange": {}}, {"repeatCell": {}}]}
+        ))
+
+    def test_append_is_not_idempotent(self):
+        self.assertFalse(_is_idempotent(
+            f"{BASE}/values/Daily%20Raw%20Metrics:append", {"values": []}
+        ))
+
+    def test_add_sheet_is_not_idempotent(self):
+        self.assertFalse(_is_idempotent(
+            f"{BASE}:batchUpdate", {"requests": [{"addSheet": {"properties": {"title": "X"}}}]}
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
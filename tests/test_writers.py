@@ -0,0 +1,142 @@
+"""Tests for the Daily Raw Metrics write helpers in tracker.writers."""
+
+import re
+import unittest
+
+from tracker.sheets_client import SheetsClient
+from tracker.writers import coalesce_row_updates, upsert_daily_rows
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a gspread Worksheet holding a list of rows."""
+
+    def __init__(self, rows):
+        self.rows = [list(r) for r in rows]
+        self.batch_calls = []
+        self.append_calls = []
+        self.append_options = []
+
+    def get(self, range_name):
+        return [r[:2] for r in self.rows]
+
+    def batch_update(self, updates):
+        self.batch_calls.append(updates)
+        for update in updates:
+            start, end = map(int, re.findall(r"\d+", update["range"]))
+            assert end - start + 1 == len(update["values"]), update["range"]
+            for offset, values in enumerate(update["values"]):
+                index = start - 1 + offset
+                while len(self.rows) <= index:
+                    self.rows.append([])
+                self.rows[index] = list(values)
+
+    def append_rows(self, rows, **options):
+        self.append_calls.append(rows)
+        self.append_options.append(options)
+        self.rows.extend(list(r) for r in rows)
+
+
+def make_sheets():
+    """Build a SheetsClient with an empty row cache and no API connection."""
+    sheets = SheetsClient.__new__(SheetsClient)
+    sheets._row_cache = {}
+    sheets._headers_verified = set()
+    sheets._config_rows = None
+    return sheets
+
+
+def row(username, date, commits):
+    """Build a Daily Raw Metrics row with a commit count and blank metrics."""
+    return [username, date, commits] + [""] * 10
+
+
+class CoalesceRowUpdatesTest(unittest.TestCase):
+    """coalesce_row_updates merges consecutive rows and keeps gaps apart."""
+
+    def test_contiguous_rows_become_one_range(self):
+        updates = coalesce_row_updates({3: ["c"], 2: ["b"], 4: ["d"]}, "M")
+        self.assertEqual(updates, [{"range": "A2:M4", "values": [["b"], ["c"], ["d"]]}])
+
+    def test_gaps_start_new_ranges(self):
+        updates = coalesce_row_updates({2: ["b"], 3: ["c"], 5: ["e"], 9: ["i"]}, "M")
+        self.assertEqual(updates, [
+            {"range": "A2:M3", "values": [["b"], ["c"]]},
+            {"range": "A5:M5", "values": [["e"]]},
+            {"range": "A9:M9", "values": [["i"]]},
+        ])
+
+    def test_no_writes(self):
+        self.assertEqual(coalesce_row_updates({}, "M"), [])
+
+
+class UpsertDailyRowsTest(unittest.TestCase):
+    """upsert_daily_rows updates known rows in place and appends the rest."""
+
+    def setUp(self):
+        self.ws = FakeWorksheet([
+            ["Username", "Date"],
+            row("alice", "2026-03-01", 1),
+            row("Bob", "2026-03-01", 2),
+            row("carol", "2026-03-01", 3),
+        ])
+        self.sheets = make_sheets()
+
+    def test_updates_in_place_and_appends_new_rows_in_order(self):
+        updated, added = upsert_daily_rows(self.sheets, self.ws, [
+            row("bob", "2026-03-01", 20),
+            row("dave", "2026-03-02", 4),
+            row("alice", "2026-03-01", 10),
+            row("erin", "2026-03-02", 5),
+        ])
+
+        self.assertEqual((updated, added), (2, 2))
+        self.assertEqual([r[:3] for r in self.ws.rows], [
+            ["Username", "Date"],
+            ["alice", "2026-03-01", 10],
+            ["bob", "2026-03-01", 20],
+            ["carol", "2026-03-01", 3],
+            ["dave", "2026-03-02", 4],
+            ["erin", "2026-03-02", 5],
+        ])
+        # Rows 2 and 3 are adjacent, so they go out as a single range.
+        self.assertEqual([u["range"] for u in self.ws.batch_calls[0]], ["A2:M3"])
+        self.assertEqual(len(self.ws.append_calls), 1)
+
+    def test_appends_insert_rows_below_the_table(self):
+        upsert_daily_rows(self.sheets, self.ws, [row("dave", "2026-03-02", 4)])
+        self.assertEqual(self.ws.append_options, [{
+            "value_input_option": "RAW",
+            "insert_data_option": "INSERT_ROWS",
+            "table_range": "A1",
+        }])
+
+    def test_later_calls_update_rows_appended_earlier(self):
+        upsert_daily_rows(self.sheets, self.ws, [row("dave", "2026-03-02", 4)])
+        updated, added = upsert_daily_rows(self.sheets, self.ws, [
+            row("dave", "2026-03-02", 40),
+            row("erin", "2026-03-02", 5),
+        ])
+
+        self.assertEqual((updated, added), (1, 1))
+        self.assertEqual(
+            self.ws.batch_calls[-1],
+            [{"range": "A5:M5", "values": [row("dave", "2026-03-02", 40)]}],
+        )
+        self.assertEqual([r[:3] for r in self.ws.rows[4:]], [
+            ["dave", "2026-03-02", 40],
+            ["erin", "2026-03-02", 5],
+        ])
+
+    def test_duplicate_new_row_is_appended_once(self):
+        updated, added = upsert_daily_rows(self.sheets, self.ws, [
+            row("dave", "2026-03-02", 4),
+            row("Dave", "2026-03-02", 6),
+        ])
+
+        self.assertEqual((updated, added), (0, 1))
+        self.assertEqual(self.ws.batch_calls, [])
+        self.assertEqual([r[:3] for r in self.ws.rows[4:]], [["Dave", "2026-03-02", 6]])
+
+
+if __name__ == "__main__":
+    unittest.main()
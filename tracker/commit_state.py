@@ -0,0 +1,26 @@
+"""On-disk record of each learner's fork commits for incremental fetches.
+
+Stores the commit SHAs and author dates already seen for a learner's fork,
+plus when they were last fetched, in a small SQLite database. The all-time
+fetch then only asks GitHub for commits since the previous run instead of
+paginating the whole history every day. A full rescan is forced
+periodically so force-pushed or rewritten history is eventually dropped.
+"""
+
+import os
+
+from tracker.store import FetchState
+
+DEFAULT_STATE_PATH = os.path.join(".cache", "commit_state.sqlite")
+
+
+class CommitState(FetchState):
+    """SQLite-backed store of {key: (since, full_at, fetched_at, commits)}."""
+
+    DEFAULT_PATH = DEFAULT_STATE_PATH
+    TABLE = "commits"
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS commits ("
+        "key TEXT PRIMARY KEY, since TEXT, full_at TEXT, "
+        "fetched_at TEXT, commits TEXT)"
+    )
@@ -0,0 +1,73 @@
+"""On-disk cache of commit line stats across runs.
+
+A commit's additions and deletions are fixed by its SHA, so once fetched
+they never need to be requested again. The stats are stored in a small
+SQLite database keyed by repo and SHA; later runs (for example the daily
+re-processing of yesterday's commits) only ask GitHub for SHAs not seen
+before.
+"""
+
+import os
+
+from tracker.store import SQLiteStore
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "commit_stats.sqlite")
+
+
+class CommitStatsCache(SQLiteStore):
+    """SQLite-backed store of {(repo, sha): (additions, deletions)}."""
+
+    DEFAULT_PATH = DEFAULT_CACHE_PATH
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS commit_stats ("
+        "repo TEXT, sha TEXT, additions INTEGER, deletions INTEGER, "
+        "PRIMARY KEY (repo, sha))"
+    )
+
+    def get_many(self, repo, shas):
+        """Look up cached stats for commits.
+
+        Args:
+            repo: The fork repo as "owner/repo".
+            shas: List of commit SHAs.
+
+        Returns:
+            Dict mapping SHA to a dict with 'additions' and 'deletions',
+            for the SHAs that are cached.
+        """
+        if not shas:
+            return {}
+        hits = {}
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for i in range(0, len(shas), 500):
+                chunk = shas[i:i + 500]
+                rows = self._conn.execute(
+                    "SELECT sha, additions, deletions FROM commit_stats "
+                    f"WHERE repo = ? AND sha IN ({','.join('?' * len(chunk))})",
+                    [repo] + chunk,
+                ).fetchall()
+                for sha, additions, deletions in rows:
+                    hits[sha] = {"additions": additions, "deletions": deletions}
+        return hits
+
+    def put_many(self, repo, stats):
+        """Store freshly fetched stats for commits.
+
+        Args:
+            repo: The fork repo as "owner/repo".
+            stats: Dict mapping SHA to 'additions'/'deletions' dicts.
+        """
+        rows = [
+            (repo, sha, s.get("additions", 0), s.get("deletions", 0))
+            for sha, s in stats.items()
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO commit_stats (repo, sha, additions, deletions) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
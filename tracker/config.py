@@ -11,11 +11,17 @@ starting row 3). Otherwise falls back to the Roster tab.
 import json
 import os
 import base64
+from datetime import datetime, timedelta, timezone
 
-from tracker.constants import EXTERNAL_GROUP_TABS
+from tracker.constants import EXTERNAL_GROUP_TABS, TIMESTAMP_FORMAT
 from tracker.github_client import GitHubClient
+from tracker.http_cache import HttpCache
+from tracker.repo_state import RepoState
 from tracker.sheets_client import SheetsClient
 
+# Fork listings are reused from RepoState for this long before refetching.
+FORK_CACHE_HOURS = 6
+
 
 def detect_group_columns(headers):
     """Detect email, name, and GitHub username column indices from headers.
@@ -63,21 +69,53 @@ def _parse_username_from_url(url):
     return url.strip().rstrip("/").split("/")[-1]
 
 
-def _resolve_forks(usernames, gh, base_repos):
+def _get_forks(gh, repo_full, repo_state=None):
+    """List a base repo's forks, reusing a recent listing when available.
+
+    Args:
+        gh: GitHubClient instance.
+        repo_full: The base repo as "owner/repo".
+        repo_state: Optional RepoState; listings younger than
+            FORK_CACHE_HOURS are served from it instead of paging through
+            the forks endpoint again.
+
+    Returns:
+        List of dicts with 'owner' ({'login'}) and 'full_name'.
+    """
+    key = f"{repo_full}:forks"
+    now = datetime.now(timezone.utc)
+    if repo_state is not None:
+        entry = repo_state.get(key)
+        fresh_after = (now - timedelta(hours=FORK_CACHE_HOURS)).strftime(TIMESTAMP_FORMAT)
+        if entry and entry["fetched_at"] >= fresh_after:
+            return entry["items"]
+
+    owner, repo = repo_full.split("/")
+    forks = [
+        {"owner": {"login": f["owner"]["login"]}, "full_name": f["full_name"]}
+        for f in gh.get_forks(owner, repo)
+    ]
+    if repo_state is not None:
+        now_iso = now.strftime(TIMESTAMP_FORMAT)
+        repo_state.put(key, "", now_iso, now_iso, forks)
+    return forks
+
+
+def _resolve_forks(usernames, gh, base_repos, repo_state=None):
     """Look up fork repos for a list of GitHub usernames.
 
     Args:
         usernames: List of GitHub username strings.
         gh: GitHubClient instance.
         base_repos: List of "owner/repo" strings to search for forks.
+        repo_state: Optional RepoState for reusing recent fork listings.
 
     Returns:
         List of learner dicts with keys: username, fork_repo, base_repo.
     """
     fork_map = {}
     for repo_full in base_repos:
-        owner, repo = repo_full.split("/")
-        forks = gh.get_forks(owner, repo)
+        forks = _get_forks(gh, repo_full, repo_state)
         for f in forks:
             fork_map[f["owner"]["login"].lower()] = {
                 "full_name": f["full_name"],
@@ -103,7 +141,7 @@ def _resolve_forks(usernames, gh, base_repos):
     return learners
 
 
-def _load_learners_from_external(sheets, gh, base_repos, config):
+def _load_learners_from_external(sheets, gh, base_repos, config, repo_state=None):
     """Read GitHub accounts from group tabs in the external sheet.
 
     Iterates over all group tabs (Igniters, Euclid, etc.), auto-detects
@@ -115,6 +153,7 @@ def _load_learners_from_external(sheets, gh, base_repos, config):
         gh: GitHubClient instance.
         base_repos: List of "owner/repo" strings to search for forks.
         config: Config dict (must contain external_sheet_id).
+        repo_state: Optional RepoState for reusing recent fork listings.
 
     Returns:
         List of learner dicts, or None if external sheet is not configured
@@ -160,10 +199,10 @@ def _load_learners_from_external(sheets, gh, base_repos, config):
             unique.append(u)
 
     print(f"  Loaded {len(unique)} learners from {len(EXTERNAL_GROUP_TABS)} group tabs")
-    return _resolve_forks(unique, gh, base_repos)
+    return _resolve_forks(unique, gh, base_repos, repo_state)
 
 
-def _load_learners_from_roster(sheets, gh, base_repos):
+def _load_learners_from_roster(sheets, gh, base_repos, repo_state=None):
     """Read GitHub accounts from the Roster tab and resolve their forks.
 
     Tries the 'Roster' tab first, falling back to the legacy 'Metrics'
@@ -174,6 +213,7 @@ def _load_learners_from_roster(sheets, gh, base_repos):
         sheets: SheetsClient instance.
         gh: GitHubClient instance.
         base_repos: List of "owner/repo" strings to search for forks.
+        repo_state: Optional RepoState for reusing recent fork listings.
 
     Returns:
         List of learner dicts with keys: username, fork_repo, base_repo.
@@ -197,7 +237,7 @@ def _load_learners_from_roster(sheets, gh, base_repos):
     if not usernames:
         return []
 
-    return _resolve_forks(usernames, gh, base_repos)
+    return _resolve_forks(usernames, gh, base_repos, repo_state)
 
 
 def load_env():
@@ -219,14 +259,27 @@ def load_env():
     sheet_id = os.environ["GOOGLE_SHEET_ID"]
 
     creds_json = json.loads(base64.b64decode(creds_b64))
-    gh = GitHubClient(token)
+    gh = GitHubClient(token, cache=HttpCache())
     sheets = SheetsClient(creds_json, sheet_id)
 
     config = sheets.read_config()
+    try:
+        cache_ttl_hours = float(config.get("cache_ttl_hours", "72"))
+    except ValueError:
+        cache_ttl_hours = 72
+    try:
+        cache_max_mb = float(config.get("cache_max_mb", "500"))
+    except ValueError:
+        cache_max_mb = 500
+    pruned = gh.cache.prune(cache_ttl_hours, max_mb=cache_max_mb)
+    if pruned:
+        print(f"Pruned {pruned} stale cached GitHub responses")
+
     base_repos = [r.strip() for r in config.get("base_repos", "ed-donner/llm_engineering").split(",")]
 
-    learners = _load_learners_from_external(sheets, gh, base_repos, config)
+    repo_state = RepoState()
+    learners = _load_learners_from_external(sheets, gh, base_repos, config, repo_state)
     if learners is None:
-        learners = _load_learners_from_roster(sheets, gh, base_repos)
+        learners = _load_learners_from_roster(sheets, gh, base_repos, repo_state)
 
     return gh, sheets, config, base_repos, learners
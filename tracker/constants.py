@@ -1,5 +1,8 @@
 """Shared header definitions and configuration defaults for all tabs."""
 
+# UTC timestamp format used for GitHub since= bounds and stored timestamps.
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
 DAILY_HEADERS = [
     "Username", "Date", "Commits", "PRs Opened", "PRs Merged",
     "Issues Opened", "Issue Comments", "PR Review Comments Given",
@@ -69,4 +72,8 @@ CONFIG_DEFAULTS = [
     ("custom_leaderboard_start", ""),
     ("custom_leaderboard_end", ""),
     ("external_sheet_id", ""),
+    ("learner_concurrency", "16"),
+    ("cache_ttl_hours", "72"),
+    ("cache_max_mb", "500"),
+    ("format_fingerprint", ""),
 ]
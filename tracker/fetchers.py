@@ -5,59 +5,317 @@ per-day metrics for a single learner, and all-time aggregated metrics
 filtered by bootcamp start date.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 
+from tracker.constants import TIMESTAMP_FORMAT
+from tracker.scoring import bootcamp_start_date
 
-def fetch_base_repo_data(gh, base_repos, since=None, include_review_comments=False):
+# Concurrent (repo, endpoint) fetches in fetch_base_repo_data.
+BASE_REPO_WORKERS = 8
+
+# Incremental commit fetches re-request this many days before the previous
+# fetch, to pick up commits pushed late with an older commit date.
+COMMIT_OVERLAP_DAYS = 2
+# Full commit history is re-fetched this often so rewritten history is dropped.
+FULL_RESCAN_DAYS = 7
+# Delta fetches of base repo items re-request this many days before the
+# previous fetch, so items updated while that run was paging are not missed.
+REPO_DELTA_OVERLAP_DAYS = 1
+
+
+def fetch_base_repo_data(gh, base_repos, since=None, include_review_comments=False,
+                         repo_state=None):
     """Fetch PRs, issues, and comments from base repos in bulk.
 
     Calls the GitHub API once per base repo to collect shared data that
     is then filtered per-learner downstream, avoiding redundant requests.
+    The endpoints for all repos are fetched concurrently.
+    A repo whose fetch still fails once the client's retries are exhausted
+    (e.g. a misconfigured entry returning 404) is logged and left out of
+    the result, so one bad repo does not abort every learner's metrics.
 
     Args:
         gh: GitHubClient instance.
         base_repos: List of "owner/repo" strings.
-        since: Optional ISO timestamp to filter comments.
+        since: Optional ISO timestamp; PRs and comments not updated since
+            then are skipped.
         include_review_comments: If True, also fetch PR review comments.
+        repo_state: Optional RepoState; when given, each endpoint only
+            requests items updated since the previous run and merges them
+            into the stored items.
 
     Returns:
         Dict mapping repo full name to a dict with keys: prs, issues,
-        comments, review_comments.
+        comments, review_comments. Repos that failed to fetch are absent.
     """
-    base_repo_data = {}
-    for repo_full in base_repos:
-        base_owner, base_repo = repo_full.split("/")
-        print(f"  Fetching base repo data: {repo_full}...")
-        try:
-            prs = gh.get_pull_requests(base_owner, base_repo, state="all")
-        except Exception:
-            prs = []
-        try:
-            issues = gh.get_issues(base_owner, base_repo)
-        except Exception:
-            issues = []
-        try:
-            comments = gh.get_issue_comments(base_owner, base_repo, since=since if since else None)
-        except Exception:
-            comments = []
+    # Every (repo, endpoint) pair is independent, so all of them run at once;
+    # the client's in-flight cap keeps the total concurrency bounded.
+    with ThreadPoolExecutor(max_workers=BASE_REPO_WORKERS) as executor:
+        futures = {}
+        for repo_full in base_repos:
+            base_owner, base_repo = repo_full.split("/")
+            print(f"  Fetching base repo data: {repo_full}...")
+            endpoints = {
+                "prs": (partial(gh.get_pull_requests, base_owner, base_repo, state="all"), since),
+                # Issues are always fetched in full; since only applies to deltas.
+                "issues": (partial(gh.get_issues, base_owner, base_repo), None),
+                "comments": (partial(gh.get_issue_comments, base_owner, base_repo), since),
+            }
+            if include_review_comments:
+                endpoints["review_comments"] = (
+                    partial(gh.get_all_pr_review_comments, base_owner, base_repo), since
+                )
+            futures[repo_full] = {
+                key: executor.submit(
+                    _fetch_repo_items, repo_state, f"{repo_full}:{key}", fetch, lower_bound
+                )
+                for key, (fetch, lower_bound) in endpoints.items()
+            }
 
-        review_comments = []
-        if include_review_comments:
-            print(f"  Fetching all PR review comments for {repo_full}...")
+        base_repo_data = {}
+        for repo_full, repo_futures in futures.items():
             try:
-                review_comments = gh.get_all_pr_review_comments(base_owner, base_repo, since=since)
-            except Exception:
-                review_comments = []
-            print(f"    Got {len(review_comments)} review comments")
+                data = {key: future.result() for key, future in repo_futures.items()}
+            except Exception as e:
+                print(f"  WARNING: Could not fetch base repo data for {repo_full}, skipping: {e}")
+                continue
+            data.setdefault("review_comments", [])
+            if include_review_comments:
+                print(f"    Got {len(data['review_comments'])} review comments for {repo_full}")
+            base_repo_data[repo_full] = data
+    return index_base_repo_data(base_repo_data)
+
+
+def _fetch_repo_items(repo_state, key, fetch, since):
+    """Fetch one base repo endpoint, incrementally when state is available.
+
+    Without a RepoState this is just fetch(since). With one, only items
+    updated since the previous fetch (less REPO_DELTA_OVERLAP_DAYS) are
+    requested and merged by id into the stored items, newer copies
+    replacing older ones. Everything since the lower bound is re-fetched
+    every FULL_RESCAN_DAYS, or when the lower bound changes.
+
+    Deltas cannot report deletions: an item deleted upstream (e.g. a
+    removed comment) stays in the stored items, and keeps being counted,
+    until the next full re-fetch drops it, i.e. for up to FULL_RESCAN_DAYS.
 
-        base_repo_data[repo_full] = {
-            "prs": prs, "issues": issues,
-            "comments": comments, "review_comments": review_comments,
-        }
+    Args:
+        repo_state: Optional RepoState.
+        key: State key for the repo endpoint, e.g. "owner/repo:prs".
+        fetch: Callable taking a since= ISO timestamp (or None) and
+            returning the list of items updated since then.
+        since: The lower bound the caller asked for, or None for all items.
+
+    Returns:
+        List of item dicts as returned by GitHub.
+    """
+    if repo_state is None:
+        return fetch(since=since)
+
+    entry = repo_state.get(key)
+    bound = since or ""
+    full, fetch_since, now_iso = _delta_plan(entry, bound, REPO_DELTA_OVERLAP_DAYS)
+    if full:
+        items = fetch(since=since)
+        repo_state.put(key, bound, now_iso, now_iso, items)
+        return items
+
+    merged = {item["id"]: item for item in entry["items"]}
+    for item in fetch(since=fetch_since):
+        merged[item["id"]] = item
+    items = list(merged.values())
+    repo_state.put(key, bound, entry["full_at"], now_iso, items)
+    return items
+
+
+def _delta_plan(entry, bound, overlap_days):
+    """Decide whether stored fetch state allows a delta fetch.
+
+    A full fetch is needed when nothing is stored, when the lower bound
+    changed, or when the last full fetch is older than FULL_RESCAN_DAYS.
+    Otherwise the delta starts overlap_days before the previous fetch,
+    but never before the lower bound.
+
+    Args:
+        entry: Stored state (with since, full_at, fetched_at), or None.
+        bound: The lower bound (ISO timestamp, or "") the caller asked for.
+        overlap_days: Days to re-request before the previous fetch.
+
+    Returns:
+        Tuple of (full, since, now): whether to fetch in full, the since
+        bound for the request, and the current time as an ISO timestamp.
+    """
+    now = datetime.now(timezone.utc)
+    now_iso = now.strftime(TIMESTAMP_FORMAT)
+    full = (
+        entry is None
+        or entry["since"] != bound
+        or entry["full_at"] < (now - timedelta(days=FULL_RESCAN_DAYS)).strftime(TIMESTAMP_FORMAT)
+    )
+    if full:
+        return True, bound, now_iso
+    overlap = _parse_timestamp(entry["fetched_at"]) - timedelta(days=overlap_days)
+    return False, max(bound, overlap.strftime(TIMESTAMP_FORMAT)), now_iso
+
+
+def index_base_repo_data(base_repo_data):
+    """Group each repo's PRs, issues, and comments by lowercased author login.
+
+    Annotates every item with precomputed login/date fields (and PRs with
+    parsed timestamps), then adds prs_by_user, issues_by_user,
+    comments_by_user, and review_comments_by_user dicts to every repo
+    entry in place, so per-learner lookups are a single dict hit instead
+    of a scan over the full lists. PRs, issues, and comments are also
+    bucketed by (login, date) into prs_by_created, prs_by_merged,
+    prs_by_closed, issues_by_created, comments_by_created, and
+    review_comments_by_created, and comments are grouped by issue/PR
+    number into comments_by_issue and review_comments_by_pr.
+
+    Args:
+        base_repo_data: Dict returned by fetch_base_repo_data.
+
+    Returns:
+        The same dict, with the index keys added.
+    """
+    for data in base_repo_data.values():
+        for key in ("prs", "issues", "comments", "review_comments"):
+            for item in data.get(key, []):
+                _annotate_item(item)
+        for pr in data.get("prs", []):
+            _annotate_pr_times(pr)
+        for key in ("prs", "issues", "comments", "review_comments"):
+            by_user = defaultdict(list)
+            for item in data.get(key, []):
+                by_user[item["_login_lc"]].append(item)
+            data[f"{key}_by_user"] = dict(by_user)
+        for key, field, name in (
+            ("prs", "_created_date", "prs_by_created"),
+            ("prs", "_merged_date", "prs_by_merged"),
+            ("issues", "_created_date", "issues_by_created"),
+            ("comments", "_created_date", "comments_by_created"),
+            ("review_comments", "_created_date", "review_comments_by_created"),
+        ):
+            data[name] = _group_by_user_date(data.get(key, []), field)
+        data["prs_by_closed"] = _group_by_user_date(
+            [p for p in data.get("prs", []) if p["state"] == "closed"], "_closed_date"
+        )
+        data["comments_by_issue"] = _group_by_number(data.get("comments", []), "issue_url")
+        data["review_comments_by_pr"] = _group_by_number(
+            data.get("review_comments", []), "pull_request_url"
+        )
     return base_repo_data
 
 
-def fetch_learner_day(gh, learner, base_repo_data, date_str):
+def _group_by_user_date(items, field):
+    """Group items by (lowercased login, date) on one of their date fields.
+
+    Items whose field is empty (e.g. unmerged PRs for _merged_date) are
+    skipped.
+
+    Args:
+        items: List of annotated PR, issue, or comment dicts.
+        field: Name of the YYYY-MM-DD field to bucket on.
+
+    Returns:
+        Dict mapping (login, date) tuples to lists of items.
+    """
+    buckets = defaultdict(list)
+    for item in items:
+        if item[field]:
+            buckets[(item["_login_lc"], item[field])].append(item)
+    return dict(buckets)
+
+
+def _group_by_number(comments, url_field):
+    """Group comments by the issue/PR number at the end of a URL field.
+
+    Args:
+        comments: List of comment dicts from the GitHub API.
+        url_field: Key of the URL ending in the number, e.g. "issue_url".
+
+    Returns:
+        Dict mapping issue/PR number to its list of comments.
+    """
+    by_number = defaultdict(list)
+    for c in comments:
+        num_str = c.get(url_field, "").split("/")[-1]
+        if num_str.isdigit():
+            by_number[int(num_str)].append(c)
+    return dict(by_number)
+
+
+def group_by_date(items, field="_created_date"):
+    """Bucket items by one of their precomputed date fields.
+
+    Lets callers that evaluate many days look up each day's items with a
+    dict hit instead of re-scanning the whole list per day. Items whose
+    field is empty (e.g. unmerged PRs for _merged_date) are skipped.
+
+    Args:
+        items: List of annotated PR, issue, or comment dicts.
+        field: Name of the YYYY-MM-DD field to bucket on.
+
+    Returns:
+        Dict mapping date string to the list of items on that date.
+    """
+    buckets = defaultdict(list)
+    for item in items:
+        if item[field]:
+            buckets[item[field]].append(item)
+    return dict(buckets)
+
+
+def _annotate_item(item):
+    """Precompute the normalized fields the per-learner filters compare on.
+
+    Adds _login_lc (lowercased author login) and _created_date,
+    _merged_date, _closed_date (YYYY-MM-DD, or "" when unset) so hot
+    loops avoid repeating str.lower() and slicing for every learner/day.
+
+    Args:
+        item: A PR, issue, or comment dict from the GitHub API.
+    """
+    item["_login_lc"] = item["user"]["login"].lower()
+    item["_created_date"] = item["created_at"][:10]
+    item["_merged_date"] = (item.get("merged_at") or "")[:10]
+    item["_closed_date"] = (item.get("closed_at") or "")[:10]
+
+
+def _annotate_pr_times(pr):
+    """Parse a PR's created/merged timestamps once into datetime fields.
+
+    Adds _created_dt and _merged_dt (None when unmerged), plus
+    _merge_hours (None when unmerged), so merge-time averages are a sum
+    over precomputed floats rather than two ISO parses and a subtraction
+    per PR on every call.
+
+    Args:
+        pr: A PR dict from the GitHub API.
+    """
+    pr["_created_dt"] = _parse_timestamp(pr["created_at"])
+    pr["_merged_dt"] = _parse_timestamp(pr["merged_at"]) if pr.get("merged_at") else None
+    pr["_merge_hours"] = (
+        (pr["_merged_dt"] - pr["_created_dt"]).total_seconds() / 3600
+        if pr["_merged_dt"] else None
+    )
+
+
+def _parse_timestamp(ts):
+    """Parse a GitHub ISO 8601 timestamp (with trailing Z) to a datetime.
+
+    Args:
+        ts: Timestamp string such as "2026-03-01T12:00:00Z".
+
+    Returns:
+        A timezone-aware datetime.
+    """
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def fetch_learner_day(gh, learner, base_repo_data, date_str, stats_cache=None):
     """Fetch all metrics for one learner on a single day.
 
     Collects commits, PRs, issues, comments, line stats, merge times,
@@ -68,6 +326,8 @@ def fetch_learner_day(gh, learner, base_repo_data, date_str):
         learner: Dict with username, fork_repo, base_repo keys.
         base_repo_data: Pre-fetched base repo data from fetch_base_repo_data.
         date_str: Date string in YYYY-MM-DD format.
+        stats_cache: Optional CommitStatsCache; commit line stats already
+            stored there are reused and only new SHAs are fetched.
 
     Returns:
         Dict of daily metrics: commits, prs_opened, prs_merged,
@@ -75,63 +335,68 @@ def fetch_learner_day(gh, learner, base_repo_data, date_str):
         lines_added, lines_deleted, avg_merge_time, rejection_rate.
     """
     username = learner["username"]
+    uname_lower = username.lower()
     fork_owner, fork_repo = learner["fork_repo"].split("/")
     since = f"{date_str}T00:00:00Z"
     until = f"{date_str}T23:59:59Z"
 
     try:
-        commits = gh.get_commits(fork_owner, fork_repo, since=since, until=until)
-        commits = [c for c in commits if c.get("author") and c["author"].get("login", "").lower() == username.lower()]
+        commits = gh.get_commits(
+            fork_owner, fork_repo, since=since, until=until, author=username
+        )
+        # author= also matches commits by email with no linked account;
+        # only commits attributed to the learner's login are counted.
+        commits = [
+            c for c in commits
+            if c.get("author") and c["author"].get("login", "").lower() == uname_lower
+        ]
     except Exception:
         commits = []
 
     total_added = 0
     total_deleted = 0
-    for commit in commits:
-        try:
-            stats = gh.get_commit_stats(fork_owner, fork_repo, commit["sha"])
+    if commits:
+        shas = [c["sha"] for c in commits]
+        commit_stats = stats_cache.get_many(learner["fork_repo"], shas) if stats_cache else {}
+        missing = [sha for sha in shas if sha not in commit_stats]
+        if missing:
+            try:
+                fetched = gh.get_commits_stats_bulk(fork_owner, fork_repo, missing)
+            except Exception:
+                fetched = {}
+            # SHAs GraphQL did not resolve are retried one by one over REST;
+            # any that still fail are neither counted nor cached.
+            unresolved = [sha for sha in missing if sha not in fetched]
+            if unresolved:
+                fetched.update(gh.get_commit_stats_many(fork_owner, fork_repo, unresolved))
+            if stats_cache:
+                stats_cache.put_many(learner["fork_repo"], fetched)
+            commit_stats.update(fetched)
+        for stats in commit_stats.values():
             total_added += stats["additions"]
             total_deleted += stats["deletions"]
-        except Exception:
-            pass
 
-    data = base_repo_data.get(learner["base_repo"], {"prs": [], "issues": [], "comments": []})
-    user_prs = [p for p in data["prs"] if p["user"]["login"].lower() == username.lower()]
+    data = base_repo_data.get(learner["base_repo"], {})
 
-    prs_opened = len([p for p in user_prs if p["created_at"][:10] == date_str])
-    merged_prs = [p for p in user_prs if p.get("merged_at") and p["merged_at"][:10] == date_str]
+    # (login, date) buckets from index_base_repo_data make each count a dict hit.
+    day_key = (uname_lower, date_str)
+    prs_opened = len(data.get("prs_by_created", {}).get(day_key, []))
+    merged_prs = data.get("prs_by_merged", {}).get(day_key, [])
     prs_merged = len(merged_prs)
+    avg_merge_time = (
+        round(sum(p["_merge_hours"] for p in merged_prs) / prs_merged, 1) if merged_prs else 0
+    )
 
-    merge_times = []
-    for pr in merged_prs:
-        created = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-        merged = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
-        merge_times.append((merged - created).total_seconds() / 3600)
-    avg_merge_time = round(sum(merge_times) / len(merge_times), 1) if merge_times else 0
-
-    closed_prs = [p for p in user_prs if p["state"] == "closed" and p.get("closed_at", "")[:10] == date_str]
+    closed_prs = data.get("prs_by_closed", {}).get(day_key, [])
     rejected = [p for p in closed_prs if not p.get("merged_at")]
     rejection_rate = round(len(rejected) / len(closed_prs), 2) if closed_prs else 0
 
-    user_issues = [i for i in data["issues"] if i["user"]["login"].lower() == username.lower()]
-    issues_opened = len([i for i in user_issues if i["created_at"][:10] == date_str])
-
-    issue_comments = len([
-        c for c in data["comments"]
-        if c["user"]["login"].lower() == username.lower() and c["created_at"][:10] == date_str
-    ])
+    issues_opened = len(data.get("issues_by_created", {}).get(day_key, []))
+    issue_comments = len(data.get("comments_by_created", {}).get(day_key, []))
 
-    review_comments_given = 0
-    base_owner, base_repo = learner["base_repo"].split("/")
-    for pr in user_prs[:10]:
-        try:
-            rc = gh.get_pr_review_comments(base_owner, base_repo, pr["number"])
-            review_comments_given += len([
-                c for c in rc
-                if c["user"]["login"].lower() == username.lower() and c["created_at"][:10] == date_str
-            ])
-        except Exception:
-            pass
+    # Review comments come from the repo-wide fetch in base_repo_data and
+    # count every PR the learner reviewed that day, not just their own.
+    review_comments_given = len(data.get("review_comments_by_created", {}).get(day_key, []))
 
     return {
         "commits": len(commits),
@@ -147,7 +412,8 @@ def fetch_learner_day(gh, learner, base_repo_data, date_str):
     }
 
 
-def fetch_learner_alltime(gh, learner, base_repo_data, config=None):
+def fetch_learner_alltime(gh, learner, base_repo_data, config=None, commit_state=None,
+                          pr_cache=None):
     """Fetch all-time aggregated metrics for one learner.
 
     Collects total commits, active days, PR stats, line counts,
@@ -160,6 +426,10 @@ def fetch_learner_alltime(gh, learner, base_repo_data, config=None):
         learner: Dict with username, fork_repo, base_repo keys.
         base_repo_data: Pre-fetched base repo data from fetch_base_repo_data.
         config: Optional config dict for bootcamp_start_date.
+        commit_state: Optional CommitState; when given, fork commits are
+            fetched incrementally since the previous run.
+        pr_cache: Optional PRStatsCache; when given, line stats are only
+            fetched for PRs updated since the previous run.
 
     Returns:
         Dict of all-time metrics: total_commits, weekly_commits,
@@ -168,43 +438,32 @@ def fetch_learner_alltime(gh, learner, base_repo_data, config=None):
         rejection_rate, last_active, last_comment.
     """
     username = learner["username"]
-    fork_owner, fork_repo = learner["fork_repo"].split("/")
+    uname_lower = username.lower()
     base_owner, base_repo = learner["base_repo"].split("/")
 
     bootcamp_start_str = (config or {}).get("bootcamp_start_date", "2026-02-23")
-    try:
-        bootcamp_start = datetime.strptime(bootcamp_start_str, "%Y-%m-%d").date()
-    except ValueError:
-        bootcamp_start = datetime(2026, 2, 23).date()
-    bootcamp_start_iso = f"{bootcamp_start.isoformat()}T00:00:00Z"
+    bootcamp_start_iso = f"{bootcamp_start_date(config or {}).isoformat()}T00:00:00Z"
 
-    try:
-        all_commits = gh.get_commits(fork_owner, fork_repo, author=username, since=bootcamp_start_iso)
-    except Exception:
-        all_commits = []
+    commit_dates = _fetch_commit_dates(
+        gh, learner["fork_repo"], username, bootcamp_start_iso, commit_state
+    )
 
-    total_commits = len(all_commits)
+    total_commits = len(commit_dates)
 
     active_dates = set()
-    for c in all_commits:
-        d = c["commit"]["author"]["date"][:10]
+    for d in commit_dates:
         if d >= bootcamp_start_str:
             active_dates.add(d)
 
-    week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).strftime("%Y-%m-%dT00:00:00Z")
-    try:
-        weekly_commits = gh.get_commits(fork_owner, fork_repo, since=week_ago, author=username)
-    except Exception:
-        weekly_commits = []
-    weekly_commit_count = len(weekly_commits)
+    # The all-time commit dates already cover the last week, so the weekly
+    # count is filtered locally instead of paging the commits API again.
+    week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).strftime("%Y-%m-%d")
+    weekly_commit_count = sum(1 for d in commit_dates if d >= week_ago)
 
-    data = base_repo_data.get(learner["base_repo"], {
-        "prs": [], "issues": [], "comments": [], "review_comments": [],
-    })
+    data = base_repo_data.get(learner["base_repo"], {})
     user_prs = [
-        p for p in data["prs"]
-        if p["user"]["login"].lower() == username.lower()
-        and p["created_at"][:10] >= bootcamp_start_str
+        p for p in data.get("prs_by_user", {}).get(uname_lower, [])
+        if p["_created_date"] >= bootcamp_start_str
     ]
 
     prs_opened = len(user_prs)
@@ -212,38 +471,33 @@ def fetch_learner_alltime(gh, learner, base_repo_data, config=None):
 
     pr_active_dates = set()
     for pr in user_prs:
-        pr_active_dates.add(pr["created_at"][:10])
+        pr_active_dates.add(pr["_created_date"])
 
     total_added = 0
     total_deleted = 0
     pr_lines = {}
+    pr_details = fetch_pr_line_stats(gh, base_owner, base_repo, user_prs, pr_cache=pr_cache)
     for pr in user_prs:
-        try:
-            pr_detail = gh.get_pr_detail(base_owner, base_repo, pr["number"])
-            additions = pr_detail.get("additions", 0)
-            deletions = pr_detail.get("deletions", 0)
-            total_added += additions
-            total_deleted += deletions
-            pr_lines[pr["number"]] = {
-                "date": pr["created_at"][:10],
-                "additions": additions,
-                "deletions": deletions,
-            }
-        except Exception:
-            pass
+        pr_detail = pr_details.get(pr["number"])
+        if pr_detail is None:
+            continue
+        additions = pr_detail.get("additions", 0)
+        deletions = pr_detail.get("deletions", 0)
+        total_added += additions
+        total_deleted += deletions
+        pr_lines[pr["number"]] = {
+            "date": pr["_created_date"],
+            "additions": additions,
+            "deletions": deletions,
+        }
 
     for pr in user_prs:
-        d = pr["created_at"][:10]
+        d = pr["_created_date"]
         if d >= bootcamp_start_str:
             active_dates.add(d)
     active_days = len(active_dates)
 
-    merge_times = []
-    for pr in user_prs:
-        if pr.get("merged_at"):
-            created = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-            merged = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
-            merge_times.append((merged - created).total_seconds() / 3600)
+    merge_times = [pr["_merge_hours"] for pr in user_prs if pr.get("merged_at")]
     avg_merge_time = round(sum(merge_times) / len(merge_times), 1) if merge_times else 0
 
     closed_prs = [p for p in user_prs if p["state"] == "closed"]
@@ -254,59 +508,39 @@ def fetch_learner_alltime(gh, learner, base_repo_data, config=None):
     last_comment_text = ""
     last_comment_date = ""
 
+    # Comments on the learner's PRs come from the repo-wide issue and review
+    # comment listings in base_repo_data, grouped by number, not per-PR calls.
+    comments_by_issue = data.get("comments_by_issue", {})
+    review_comments_by_pr = data.get("review_comments_by_pr", {})
     for pr in user_prs:
-        try:
-            pr_comments = gh._request(
-                f"{gh.BASE_URL}/repos/{base_owner}/{base_repo}/issues/{pr['number']}/comments"
-            )
-            for c in pr_comments:
-                if c["created_at"][:10] < bootcamp_start_str:
-                    continue
-                if c["user"]["login"].lower() != username.lower():
-                    comments_received += 1
-                if c["created_at"] > last_comment_date:
-                    last_comment_date = c["created_at"]
-                    last_comment_text = c.get("body", "")
-        except Exception:
-            pass
-
-    all_review_comments = data.get("review_comments", [])
-    user_pr_numbers = {pr["number"] for pr in user_prs}
-    for c in all_review_comments:
-        pr_url = c.get("pull_request_url", "")
-        pr_num_str = pr_url.split("/")[-1]
-        if not pr_num_str.isdigit():
-            continue
-        pr_num = int(pr_num_str)
-        if pr_num not in user_pr_numbers:
-            continue
-        if c["created_at"][:10] < bootcamp_start_str:
-            continue
-        if c["user"]["login"].lower() != username.lower():
-            comments_received += 1
-        if c["created_at"] > last_comment_date:
-            last_comment_date = c["created_at"]
-            last_comment_text = c.get("body", "")
+        pr_comments = (
+            comments_by_issue.get(pr["number"], []) + review_comments_by_pr.get(pr["number"], [])
+        )
+        for c in pr_comments:
+            if c["_created_date"] < bootcamp_start_str:
+                continue
+            if c["_login_lc"] != uname_lower:
+                comments_received += 1
+            if c["created_at"] > last_comment_date:
+                last_comment_date = c["created_at"]
+                last_comment_text = c.get("body", "")
 
     if len(last_comment_text) > 200:
         last_comment_text = last_comment_text[:200] + "..."
 
-    all_issue_comments = data.get("comments", [])
-    comments_given = len([
-        c for c in all_issue_comments
-        if c["user"]["login"].lower() == username.lower()
-        and c["created_at"][:10] >= bootcamp_start_str
-    ])
-    comments_given += len([
-        c for c in all_review_comments
-        if c["user"]["login"].lower() == username.lower()
-        and c["created_at"][:10] >= bootcamp_start_str
-    ])
+    user_issue_comments = data.get("comments_by_user", {}).get(uname_lower, [])
+    user_review_comments = data.get("review_comments_by_user", {}).get(uname_lower, [])
+    comments_given_dates = (
+        [c["_created_date"] for c in user_issue_comments
+         if c["_created_date"] >= bootcamp_start_str]
+        + [c["_created_date"] for c in user_review_comments
+           if c["_created_date"] >= bootcamp_start_str]
+    )
+    comments_given = len(comments_given_dates)
 
     user_issues = [
-        i for i in data["issues"]
-        if i["user"]["login"].lower() == username.lower()
-        and i["created_at"][:10] >= bootcamp_start_str
+        i for i in data.get("issues_by_user", {}).get(uname_lower, [])
+        if i["_created_date"] >= bootcamp_start_str
     ]
     issues_opened = len(user_issues)
 
@@ -329,22 +563,96 @@ def fetch_learner_alltime(gh, learner, base_repo_data, config=None):
         "last_active": last_active,
         "last_comment": last_comment_text,
         # Raw date-tagged data for period filtering (no extra API calls)
-        "_commit_dates": [c["commit"]["author"]["date"][:10] for c in all_commits
-                          if c["commit"]["author"]["date"][:10] >= bootcamp_start_str],
+        "_commit_dates": [d for d in commit_dates if d >= bootcamp_start_str],
         "_user_prs": user_prs,
         "_user_issues": user_issues,
-        "_comments_given_dates": (
-            [c["created_at"][:10] for c in all_issue_comments
-             if c["user"]["login"].lower() == username.lower()
-             and c["created_at"][:10] >= bootcamp_start_str]
-            + [c["created_at"][:10] for c in all_review_comments
-               if c["user"]["login"].lower() == username.lower()
-               and c["created_at"][:10] >= bootcamp_start_str]
-        ),
+        "_comments_given_dates": comments_given_dates,
         "_pr_lines": pr_lines,
     }
 
 
+def fetch_pr_line_stats(gh, owner, repo, prs, pr_cache=None):
+    """Fetch additions/deletions for PRs, batched through GraphQL.
+
+    PRs the GraphQL request does not resolve (or all of them, if it fails)
+    are fetched with concurrent per-PR REST calls. With a PRStatsCache,
+    PRs whose updated_at is unchanged since they were cached are served
+    from it and only the rest are fetched.
+
+    Args:
+        gh: GitHubClient instance.
+        owner: Repository owner.
+        repo: Repository name.
+        prs: List of PR dicts from the GitHub API.
+        pr_cache: Optional PRStatsCache shared across runs.
+
+    Returns:
+        Dict mapping PR number to a dict with 'additions' and 'deletions'.
+        PRs whose stats could not be fetched are omitted.
+    """
+    repo_full = f"{owner}/{repo}"
+    details = pr_cache.get_many(repo_full, prs) if pr_cache is not None else {}
+    missing = [pr for pr in prs if pr["number"] not in details]
+    if not missing:
+        return details
+    pr_numbers = [pr["number"] for pr in missing]
+    try:
+        fetched = gh.get_pr_details_bulk(owner, repo, pr_numbers)
+    except Exception:
+        fetched = {}
+    # PRs GraphQL did not resolve are retried one by one over REST; any
+    # that still fail are neither returned nor cached.
+    unresolved = [n for n in pr_numbers if n not in fetched]
+    if unresolved:
+        fetched.update(gh.get_pr_details_many(owner, repo, unresolved))
+    if pr_cache is not None:
+        pr_cache.put_many(repo_full, missing, fetched)
+    details.update(fetched)
+    return details
+
+
+def _fetch_commit_dates(gh, fork_full, username, since_iso, commit_state=None):
+    """Fetch the author dates of a learner's commits on their fork.
+
+    With a CommitState, only commits since the previous fetch (less an
+    overlap window) are requested and merged into the stored set; the
+    full history since since_iso is re-fetched every FULL_RESCAN_DAYS or
+    when since_iso changes. If the fetch fails, the stored commits are
+    used as-is.
+
+    Args:
+        gh: GitHubClient instance.
+        fork_full: The fork as "owner/repo".
+        username: The learner's GitHub username.
+        since_iso: ISO timestamp of the earliest commit to count.
+        commit_state: Optional CommitState for incremental fetches.
+
+    Returns:
+        List of commit dates (YYYY-MM-DD), one per commit.
+    """
+    fork_owner, fork_repo = fork_full.split("/")
+    if commit_state is None:
+        try:
+            commits = gh.get_commits(fork_owner, fork_repo, author=username, since=since_iso)
+        except Exception:
+            commits = []
+        return [c["commit"]["author"]["date"][:10] for c in commits]
+
+    key = f"{fork_full}:{username.lower()}"
+    entry = commit_state.get(key)
+    full, fetch_since, now_iso = _delta_plan(entry, since_iso, COMMIT_OVERLAP_DAYS)
+    try:
+        commits = gh.get_commits(fork_owner, fork_repo, author=username, since=fetch_since)
+    except Exception:
+        return [d[:10] for d in entry["commits"].values()] if entry else []
+
+    known = {} if full else entry["commits"]
+    for c in commits:
+        known[c["sha"]] = c["commit"]["author"]["date"]
+    commit_state.put(key, since_iso, now_iso if full else entry["full_at"], now_iso, known)
+    return [d[:10] for d in known.values()]
+
+
 def compute_period_metrics(alltime_metrics, start_date, end_date):
     """Filter all-time raw data to a date range and return period metrics.
 
@@ -365,16 +673,16 @@ def compute_period_metrics(alltime_metrics, start_date, end_date):
 
     user_prs = alltime_metrics.get("_user_prs", [])
     # PRs created in the period
-    period_prs_created = [p for p in user_prs if start_date <= p["created_at"][:10] <= end_date]
+    period_prs_created = [p for p in user_prs if start_date <= p["_created_date"] <= end_date]
     # PRs merged in the period (even if created earlier — reflects ongoing work)
-    period_prs_merged = [p for p in user_prs
-                         if p.get("merged_at") and start_date <= p["merged_at"][:10] <= end_date]
+    # (_merged_date is "" for unmerged PRs, which never falls in the range.)
+    period_prs_merged = [p for p in user_prs if start_date <= p["_merged_date"] <= end_date]
     # PRs active in the period: created OR merged during this window
     period_pr_numbers = {p["number"] for p in period_prs_created} | {p["number"] for p in period_prs_merged}
     period_prs = [p for p in user_prs if p["number"] in period_pr_numbers]
 
     user_issues = alltime_metrics.get("_user_issues", [])
-    period_issues = [i for i in user_issues if start_date <= i["created_at"][:10] <= end_date]
+    period_issues = [i for i in user_issues if start_date <= i["_created_date"] <= end_date]
 
     comment_dates = [d for d in alltime_metrics.get("_comments_given_dates", [])
                      if start_date <= d <= end_date]
@@ -384,26 +692,14 @@ def compute_period_metrics(alltime_metrics, start_date, end_date):
     lines_added = sum(v["additions"] for num, v in pr_lines.items() if num in period_pr_numbers)
     lines_deleted = sum(v["deletions"] for num, v in pr_lines.items() if num in period_pr_numbers)
 
-    active_dates = set(commit_dates)
-    for p in period_prs_created:
-        active_dates.add(p["created_at"][:10])
-    for p in period_prs_merged:
-        active_dates.add(p["merged_at"][:10])
-    for i in period_issues:
-        active_dates.add(i["created_at"][:10])
+    pr_active_dates = {p["_created_date"] for p in period_prs_created}
+    pr_active_dates.update(p["_merged_date"] for p in period_prs_merged)
+
+    active_dates = set(commit_dates) | pr_active_dates
+    active_dates.update(i["_created_date"] for i in period_issues)
     active_dates.update(comment_dates)
 
-    pr_active_dates = set()
-    for p in period_prs_created:
-        pr_active_dates.add(p["created_at"][:10])
-    for p in period_prs_merged:
-        pr_active_dates.add(p["merged_at"][:10])
-
-    merge_times = []
-    for pr in period_prs_merged:
-        created = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-        merged = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
-        merge_times.append((merged - created).total_seconds() / 3600)
+    merge_times = [pr["_merge_hours"] for pr in period_prs_merged]
     avg_merge_time = round(sum(merge_times) / len(merge_times), 1) if merge_times else 0
 
     prs_opened = len(period_prs_created)
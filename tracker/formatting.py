@@ -5,7 +5,15 @@ defaults, and applying colors, filters, and conditional formatting
 to all tabs in the Google Sheet.
 """
 
+import hashlib
+import json
+from collections import namedtuple
+
 from tracker.constants import CONFIG_DEFAULTS
+from tracker.sheets_client import column_letter
+
+# Sheet id and column count of a tab, as read from spreadsheet metadata.
+_TabGrid = namedtuple("_TabGrid", "id col_count")
 
 
 def setup_sheet_structure(sheets):
@@ -30,7 +38,7 @@ def setup_sheet_structure(sheets):
             print("  Renamed 'Metrics' → 'Roster'")
             rows = metrics_ws.get_all_values()
             if rows and len(rows[0]) > 2:
-                last_col = chr(64 + len(rows[0])) if len(rows[0]) <= 26 else "Z"
+                last_col = column_letter(len(rows[0]))
                 metrics_ws.batch_clear([f"C1:{last_col}{len(rows)}"])
                 print("  Cleared columns C-N from Roster tab")
         except Exception:
@@ -73,27 +81,35 @@ def ensure_config_defaults(sheets):
     missing = [[key, value] for key, value in CONFIG_DEFAULTS if key not in existing_keys]
 
     if missing:
+        # The missing keys go on consecutive rows, so one range covers them.
         next_row = len(existing) + 1
-        updates = [
-            {"range": f"A{next_row + i}:B{next_row + i}", "values": [row_data]}
-            for i, row_data in enumerate(missing)
-        ]
-        ws.batch_update(updates)
+        ws.update(
+            values=missing, range_name=f"A{next_row}:B{next_row + len(missing) - 1}",
+            value_input_option="RAW",
+        )
+        # Refresh the remembered key rows so update_config sees the new keys.
+        sheets.read_config()
         print(f"  Added {len(missing)} missing config keys")
     else:
         print("  All config keys present")
 
 
-def format_sheets(sheets):
+def format_sheets(sheets, config=None):
     """Apply formatting, colors, filters, and conditional formatting to all tabs.
 
-    Runs in two phases: first cleans up existing conditional formats and
-    basic filters, then applies tab colors, frozen headers, header styling,
-    auto-filters, column auto-resize, and classification/score/alert
-    conditional formatting rules in a single batch update.
+    Cleans up existing conditional formats and basic filters, then applies
+    tab colors, frozen headers, header styling, auto-filters, column
+    auto-resize, and classification/score/alert conditional formatting
+    rules. Both phases go out in a single batch update; Sheets applies the
+    requests in order, so the cleanup runs before the new rules are added.
+
+    The formatting requests are fingerprinted and the hash is stored as
+    format_fingerprint in the Config tab; when config already holds the
+    same hash (same tabs, sheet ids, sizes and rules), nothing is written.
 
     Args:
         sheets: SheetsClient instance.
+        config: Optional config dict; enables skipping unchanged formatting.
     """
     print("\nFormatting sheets...")
     sp = sheets.spreadsheet
@@ -119,19 +135,18 @@ def format_sheets(sheets):
         if "basicFilter" in sheet_data:
             cleanup_requests.append({"clearBasicFilter": {"sheetId": sheet_id}})
 
-    if cleanup_requests:
-        sp.batch_update({"requests": cleanup_requests})
-
     tab_names = [
         "Summary", "Roster", "Leaderboard", "Weekly Leaderboard", "Monthly Leaderboard",
         "Custom Leaderboard", "Daily View", "Alerts", "Daily Raw Metrics", "Config",
     ]
-    tabs = {}
-    for name in tab_names:
-        try:
-            tabs[name] = sp.worksheet(name)
-        except Exception:
-            pass
+    # Resolve tabs from the metadata fetched above; sp.worksheet() would
+    # refetch the metadata once per tab.
+    grids = {}
+    for sheet_data in metadata.get("sheets", []):
+        props = sheet_data["properties"]
+        grid = props.get("gridProperties", {})
+        grids[props["title"]] = _TabGrid(props["sheetId"], grid.get("columnCount", 0))
+    tabs = {name: grids[name] for name in tab_names if name in grids}
 
     tab_colors = {
         "Summary": "#4472C4",
@@ -152,7 +167,6 @@ def format_sheets(sheets):
 
     for tab_name, ws in tabs.items():
         num_cols = ws.col_count
-        num_rows = ws.row_count
 
         requests.append({
             "updateSheetProperties": {
@@ -200,7 +214,6 @@ def format_sheets(sheets):
                     "range": {
                         "sheetId": ws.id,
                         "startRowIndex": 0,
-                        "endRowIndex": num_rows,
                         "startColumnIndex": 0,
                         "endColumnIndex": num_cols,
                     }
@@ -326,8 +339,14 @@ def format_sheets(sheets):
                 }
             })
 
-    if requests:
-        sp.batch_update({"requests": requests})
+    fingerprint = hashlib.sha1(json.dumps(requests, sort_keys=True).encode()).hexdigest()
+    if config is not None and config.get("format_fingerprint") == fingerprint:
+        print("  Formatting unchanged; skipping (clear format_fingerprint in Config to force)")
+        return
+
+    if cleanup_requests or requests:
+        sp.batch_update({"requests": cleanup_requests + requests})
+    sheets.update_config("format_fingerprint", fingerprint)
 
     print("  Formatting applied to all tabs")
 
@@ -357,14 +376,14 @@ def protect_sheets(sheets):
             existing_protected.add(sheet_data["properties"]["sheetId"])
 
     requests = []
-    all_ws = sp.worksheets()
-    for ws in all_ws:
-        if ws.id in existing_protected:
+    for sheet_data in metadata.get("sheets", []):
+        sheet_id = sheet_data["properties"]["sheetId"]
+        if sheet_id in existing_protected:
             continue
         requests.append({
             "addProtectedRange": {
                 "protectedRange": {
-                    "range": {"sheetId": ws.id},
+                    "range": {"sheetId": sheet_id},
                     "description": "Locked by scoring system",
                     "warningOnly": False,
                     "editors": {"users": [editor_email]},
@@ -1,7 +1,65 @@
 """GitHub REST API client with automatic pagination and rate-limit handling."""
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from tracker.retry import retry_with_backoff
+
+# Connection pool size; sized for concurrent per-learner fetches sharing one session.
+# The pool blocks when exhausted so threads wait for a kept-alive connection
+# instead of opening (and then discarding) extra TLS connections.
+POOL_SIZE = 32
+
+# Upper bound on requests in flight at once across all threads. Nested thread
+# pools (learners x commits) would otherwise multiply concurrency and trip
+# GitHub's secondary rate limits.
+MAX_IN_FLIGHT = 16
+
+# Requests started per minute across all threads. GitHub's secondary rate limit
+# allows 900 REST points a minute; pacing below it avoids bursts of 403s.
+MAX_REQUESTS_PER_MINUTE = 800
+
+
+class _Throttle:
+    """Thread-safe request pacer shared by all threads of a client.
+
+    Spaces request starts at least 60 / per_minute seconds apart, and holds
+    every thread back while GitHub has asked the client to pause (a
+    Retry-After or an exhausted rate limit seen by any thread).
+    """
+
+    def __init__(self, per_minute):
+        """Create a throttle.
+
+        Args:
+            per_minute: Maximum number of request starts per minute.
+        """
+        self._interval = 60.0 / per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    def wait(self):
+        """Block until this thread may start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot, self._paused_until)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def pause(self, seconds):
+        """Hold all threads back for the given number of seconds.
+
+        Args:
+            seconds: How long no new request should start.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
 
 
 class GitHubClient:
@@ -13,70 +71,219 @@ class GitHubClient:
     """
 
     BASE_URL = "https://api.github.com"
+    GRAPHQL_URL = "https://api.github.com/graphql"
 
-    def __init__(self, token):
+    def __init__(self, token, cache=None):
         """Initialize with a GitHub personal access token.
 
         Args:
             token: GitHub PAT with repo read access.
+            cache: Optional HttpCache used for conditional (ETag) requests.
         """
+        self.cache = cache
+        self._in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+        self._throttle = _Throttle(MAX_REQUESTS_PER_MINUTE)
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, pool_block=True)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             "Authorization": f"token {token}",
             "Accept": "application/vnd.github.v3+json",
         })
 
-    def _request(self, url, params=None, max_retries=3):
+    @retry_with_backoff()
+    def _get(self, url, params=None, headers=None):
+        """Issue a single GET, retrying rate limits and transient errors.
+
+        Args:
+            url: The full API URL to request.
+            params: Optional query parameters dict.
+            headers: Optional extra request headers.
+
+        Returns:
+            The requests.Response (a 304 is returned rather than raised).
+        """
+        resp = self._send("GET", url, params=params, headers=headers)
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return resp
+
+    def _send(self, method, url, **kwargs):
+        """Send one request through the shared throttle and in-flight cap.
+
+        When GitHub signals a rate limit (Retry-After, or no requests
+        remaining), every thread is paused until it clears rather than only
+        the one that received it, so parallel fetches do not keep firing
+        into the limit while the caller backs off and retries.
+
+        Args:
+            method: HTTP method, e.g. "GET".
+            url: The full URL to request.
+            **kwargs: Passed through to requests.Session.request.
+
+        Returns:
+            The requests.Response.
+        """
+        self._throttle.wait()
+        with self._in_flight:
+            resp = self.session.request(method, url, **kwargs)
+        if resp.status_code in (403, 429):
+            headers = resp.headers
+            if "Retry-After" in headers:
+                try:
+                    self._throttle.pause(float(headers["Retry-After"]))
+                except ValueError:
+                    pass
+            elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+                self._throttle.pause(max(int(headers["X-RateLimit-Reset"]) - time.time(), 1))
+        return resp
+
+    def _request(self, url, params=None, conditional=False, stop=None):
         """Make a GET request with retry, backoff, and automatic pagination.
 
-        Handles rate limiting by sleeping until the reset window, retries
-        on 5xx errors with exponential backoff, and follows pagination
-        links to collect all results.
+        Each page is fetched through _get, which sleeps through rate limits
+        and retries transient errors with exponential backoff. Follows
+        pagination links to collect all results. When conditional is set
+        and a cache is configured, each page is requested with If-None-Match
+        (or If-Modified-Since when only Last-Modified was returned) and a
+        304 response is served from the cache.
 
         Args:
             url: The full API URL to request.
             params: Optional query parameters dict.
-            max_retries: Maximum retry attempts per page.
+            conditional: If True, use the ETag cache for this request.
+                Callers pass False when the URL carries a moving since
+                bound: each new value is a new URL that can never
+                revalidate, so caching it would only add single-use entries.
+            stop: Optional predicate called with the last item of each page;
+                pagination ends once it returns True.
 
         Returns:
             A list of results (for paginated endpoints) or a single dict.
         """
         results = []
-        backoff = 1
 
         while url:
-            for attempt in range(max_retries):
-                resp = self.session.get(url, params=params)
-
-                if resp.status_code == 403 and "rate limit" in resp.text.lower():
-                    reset = int(resp.headers.get("X-RateLimit-Reset", time.time() + 60))
-                    wait = max(reset - int(time.time()), 1)
-                    print(f"Rate limited. Sleeping {wait}s...")
-                    time.sleep(wait)
-                    continue
-
-                if resp.status_code >= 500:
-                    time.sleep(backoff)
-                    backoff *= 2
-                    continue
-
+            cache_key = None
+            cached = None
+            headers = None
+            if conditional and self.cache is not None:
+                cache_key = requests.Request("GET", url, params=params).prepare().url
+                cached = self.cache.get(cache_key)
+                if cached:
+                    etag, last_modified = cached[0], cached[1]
+                    if etag:
+                        headers = {"If-None-Match": etag}
+                    elif last_modified:
+                        headers = {"If-Modified-Since": last_modified}
+
+            resp = self._get(url, params=params, headers=headers)
+
+            if resp.status_code == 304 and cached:
+                _, _, data, next_url = cached
+                self.cache.touch(cache_key)
+            else:
                 resp.raise_for_status()
                 data = resp.json()
+                next_url = resp.links.get("next", {}).get("url")
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+                if cache_key and (etag or last_modified):
+                    self.cache.put(cache_key, etag, data, next_url, last_modified=last_modified)
 
-                if isinstance(data, list):
-                    results.extend(data)
-                else:
-                    return data
+            if not isinstance(data, list):
+                return data
+            results.extend(data)
 
+            if stop and data and stop(data[-1]):
                 break
-            else:
-                resp.raise_for_status()
-
-            url = resp.links.get("next", {}).get("url")
+            url = next_url
             params = None
 
         return results
 
+    @staticmethod
+    def _fetch_many(fn, keys, workers):
+        """Call fn for each key concurrently on a small thread pool.
+
+        Args:
+            fn: Function taking one key and returning its result.
+            keys: List of keys to fetch.
+            workers: Maximum number of concurrent calls.
+
+        Returns:
+            Dict mapping each key to fn's result. Keys whose call raised
+            are left out.
+        """
+        def fetch(key):
+            try:
+                return key, fn(key)
+            except Exception:
+                return key, None
+
+        if not keys:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(keys)))) as executor:
+            return {k: v for k, v in executor.map(fetch, keys) if v is not None}
+
+    @retry_with_backoff()
+    def graphql(self, query, variables=None):
+        """Run a GraphQL query, retrying rate limits and transient errors.
+
+        Args:
+            query: The GraphQL query document.
+            variables: Optional dict of query variables.
+
+        Returns:
+            The "data" dict from the GraphQL response.
+
+        Raises:
+            RuntimeError: If the response contains errors and no data.
+        """
+        resp = self._send(
+            "POST", self.GRAPHQL_URL, json={"query": query, "variables": variables or {}}
+        )
+        resp.raise_for_status()
+        body = resp.json()
+        if body.get("errors") and not body.get("data"):
+            raise RuntimeError(f"GraphQL error: {body['errors'][0].get('message', body['errors'])}")
+        return body.get("data") or {}
+
+    def _graphql_lines_bulk(self, owner, repo, keys, selection, chunk_size):
+        """Resolve additions/deletions for many objects with aliased GraphQL lookups.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            keys: List of keys (commit SHAs or PR numbers).
+            selection: Function mapping a key to its GraphQL field selection
+                under ``repository``, returning additions and deletions.
+            chunk_size: Maximum number of lookups per GraphQL request.
+
+        Returns:
+            Dict mapping key to a dict with 'additions' and 'deletions'.
+            Keys whose node is null or missing (e.g. on a partial error)
+            are left out.
+        """
+        results = {}
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start:start + chunk_size]
+            fields = " ".join(f"n{i}: {selection(key)}" for i, key in enumerate(chunk))
+            query = (
+                "query($owner: String!, $name: String!) { "
+                f"repository(owner: $owner, name: $name) {{ {fields} }} }}"
+            )
+            data = self.graphql(query, {"owner": owner, "name": repo})
+            repo_data = data.get("repository") or {}
+            for i, key in enumerate(chunk):
+                node = repo_data.get(f"n{i}")
+                if node and "additions" in node:
+                    results[key] = {
+                        "additions": node["additions"],
+                        "deletions": node.get("deletions", 0),
+                    }
+        return results
+
     def get_forks(self, owner, repo):
         """List all forks of a repository.
 
@@ -132,22 +339,80 @@ class GitHubClient:
             "deletions": stats.get("deletions", 0),
         }
 
-    def get_pull_requests(self, owner, repo, state="all", author=None):
+    def get_commit_stats_many(self, owner, repo, shas, workers=8):
+        """Fetch stats for many commits concurrently over the REST API.
+
+        Overlaps the per-commit round-trips on a small thread pool. Commits
+        whose stats cannot be fetched are left out of the result.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            shas: List of commit SHAs.
+            workers: Maximum number of concurrent requests.
+
+        Returns:
+            Dict mapping each SHA to a dict with 'additions' and 'deletions'.
+        """
+        return self._fetch_many(
+            lambda sha: self.get_commit_stats(owner, repo, sha), shas, workers
+        )
+
+    def get_commits_stats_bulk(self, owner, repo, shas, chunk_size=100):
+        """Fetch line addition/deletion stats for many commits via GraphQL.
+
+        Aliases one ``object(oid: ...)`` lookup per SHA so up to
+        ``chunk_size`` commits are resolved in a single request, instead
+        of one REST call per commit.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            shas: List of commit SHAs.
+            chunk_size: Maximum number of commits per GraphQL request.
+
+        Returns:
+            Dict mapping SHA to a dict with 'additions' and 'deletions'.
+            Commits GraphQL did not resolve (null or missing nodes, e.g. on
+            a partial error) are left out so callers can fall back to REST.
+        """
+        return self._graphql_lines_bulk(
+            owner, repo, shas,
+            lambda sha: f'object(oid: "{sha}") {{ ... on Commit {{ additions deletions }} }}',
+            chunk_size,
+        )
+
+    def get_pull_requests(self, owner, repo, state="all", author=None, since=None):
         """Fetch pull requests, optionally filtered by author client-side.
 
+        When since is given, PRs are requested most recently updated first
+        and pagination stops at the first page that reaches PRs last updated
+        before since, so old history is not downloaded on every run.
+
         Args:
             owner: Repository owner.
             repo: Repository name.
             state: PR state filter ('open', 'closed', 'all').
             author: Optional username for client-side filtering.
+            since: Optional ISO timestamp; only PRs updated at or after it
+                are returned.
 
         Returns:
             List of PR dicts.
         """
+        params = {"per_page": 100, "state": state}
+        stop = None
+        if since:
+            params.update({"sort": "updated", "direction": "desc"})
+            stop = lambda pr: pr["updated_at"] < since
         prs = self._request(
             f"{self.BASE_URL}/repos/{owner}/{repo}/pulls",
-            params={"per_page": 100, "state": state},
+            params=params,
+            conditional=True,
+            stop=stop,
         )
+        if since:
+            prs = [pr for pr in prs if pr["updated_at"] >= since]
         if author:
             prs = [pr for pr in prs if pr["user"]["login"].lower() == author.lower()]
         return prs
@@ -167,23 +432,51 @@ class GitHubClient:
             f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/{pr_number}"
         )
 
-    def get_pr_reviews(self, owner, repo, pr_number):
-        """Fetch reviews on a pull request.
+    def get_pr_details_many(self, owner, repo, pr_numbers, workers=8):
+        """Fetch details for many PRs concurrently over the REST API.
+
+        Overlaps the per-PR round-trips on a small thread pool. PRs whose
+        details cannot be fetched are left out of the result.
 
         Args:
             owner: Repository owner.
             repo: Repository name.
-            pr_number: The PR number.
+            pr_numbers: List of PR numbers.
+            workers: Maximum number of concurrent requests.
 
         Returns:
-            List of review dicts.
+            Dict mapping each PR number to its detail dict.
         """
-        return self._request(
-            f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
+        return self._fetch_many(
+            lambda number: self.get_pr_detail(owner, repo, number), pr_numbers, workers
         )
 
-    def get_pr_review_comments(self, owner, repo, pr_number):
-        """Fetch inline review comments on a pull request.
+    def get_pr_details_bulk(self, owner, repo, pr_numbers, chunk_size=100):
+        """Fetch line addition/deletion counts for many PRs via GraphQL.
+
+        Aliases one ``pullRequest(number: ...)`` lookup per PR so up to
+        ``chunk_size`` PRs are resolved in a single request, instead of
+        one REST call per PR.
+
+        Args:
+            owner: Repository owner.
+            repo: Repository name.
+            pr_numbers: List of PR numbers.
+            chunk_size: Maximum number of PRs per GraphQL request.
+
+        Returns:
+            Dict mapping each PR number to a dict with 'additions' and
+            'deletions'. PRs GraphQL did not resolve are left out so
+            callers can fall back to REST.
+        """
+        return self._graphql_lines_bulk(
+            owner, repo, pr_numbers,
+            lambda number: f"pullRequest(number: {int(number)}) {{ additions deletions }}",
+            chunk_size,
+        )
+
+    def get_pr_reviews(self, owner, repo, pr_number):
+        """Fetch reviews on a pull request.
 
         Args:
             owner: Repository owner.
@@ -191,10 +484,10 @@ class GitHubClient:
             pr_number: The PR number.
 
         Returns:
-            List of review comment dicts.
+            List of review dicts.
         """
         return self._request(
-            f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/{pr_number}/comments"
+            f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
         )
 
     def get_all_pr_review_comments(self, owner, repo, since=None):
@@ -212,10 +505,11 @@ class GitHubClient:
         if since:
             params["since"] = since
         return self._request(
-            f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/comments", params
+            f"{self.BASE_URL}/repos/{owner}/{repo}/pulls/comments", params,
+            conditional=not since,
         )
 
-    def get_issues(self, owner, repo, creator=None, state="all"):
+    def get_issues(self, owner, repo, creator=None, state="all", since=None):
         """Fetch issues (excluding pull requests) for a repository.
 
         Args:
@@ -223,6 +517,8 @@ class GitHubClient:
             repo: Repository name.
             creator: Optional username to filter by issue creator.
             state: Issue state filter ('open', 'closed', 'all').
+            since: Optional ISO timestamp; only issues updated at or after
+                it are returned.
 
         Returns:
             List of issue dicts (PRs filtered out).
@@ -230,7 +526,11 @@ class GitHubClient:
         params = {"per_page": 100, "state": state}
         if creator:
             params["creator"] = creator
-        issues = self._request(f"{self.BASE_URL}/repos/{owner}/{repo}/issues", params)
+        if since:
+            params["since"] = since
+        issues = self._request(
+            f"{self.BASE_URL}/repos/{owner}/{repo}/issues", params, conditional=not since
+        )
         return [i for i in issues if "pull_request" not in i]
 
     def get_issue_comments(self, owner, repo, since=None):
@@ -248,5 +548,6 @@ class GitHubClient:
         if since:
             params["since"] = since
         return self._request(
-            f"{self.BASE_URL}/repos/{owner}/{repo}/issues/comments", params
+            f"{self.BASE_URL}/repos/{owner}/{repo}/issues/comments", params,
+            conditional=not since,
         )
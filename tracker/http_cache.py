@@ -0,0 +1,123 @@
+"""On-disk cache of GitHub API responses for conditional requests.
+
+Stores the ETag (or Last-Modified), JSON body, and next-page link of each
+requested URL in a small SQLite database. Repeat fetches send
+If-None-Match / If-Modified-Since and reuse the cached body when GitHub
+answers 304 Not Modified, which does not count against the rate limit.
+Entries not used within a configurable TTL are pruned, as are the least
+recently used entries once the cache exceeds a size cap.
+"""
+
+import json
+import os
+import time
+
+from tracker.store import SQLiteStore
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "github_http.sqlite")
+
+
+class HttpCache(SQLiteStore):
+    """SQLite-backed store of cached responses keyed by URL.
+
+    Each row holds (etag, last_modified, body, next_url, fetched_at).
+    """
+
+    DEFAULT_PATH = DEFAULT_CACHE_PATH
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "url TEXT PRIMARY KEY, etag TEXT, body TEXT, "
+        "next_url TEXT, fetched_at REAL, last_modified TEXT)"
+    )
+
+    def _migrate(self):
+        """Add columns missing from caches restored from older versions."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "last_modified" not in columns:
+            # Caches restored from before Last-Modified support.
+            self._conn.execute("ALTER TABLE responses ADD COLUMN last_modified TEXT")
+
+    def get(self, url):
+        """Look up a cached response.
+
+        Args:
+            url: The full request URL including query string.
+
+        Returns:
+            Tuple of (etag, last_modified, body, next_url), or None if not
+            cached.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body, next_url FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, body, next_url = row
+        return etag, last_modified, json.loads(body), next_url
+
+    def put(self, url, etag, body, next_url=None, last_modified=None):
+        """Store or replace a cached response.
+
+        Args:
+            url: The full request URL including query string.
+            etag: The ETag header returned by GitHub, if any.
+            body: The decoded JSON body.
+            next_url: The pagination "next" link, if any.
+            last_modified: The Last-Modified header returned by GitHub, if any.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, body, next_url, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, json.dumps(body), next_url, time.time()),
+            )
+            self._conn.commit()
+
+    def touch(self, url):
+        """Mark a cached response as just revalidated (after a 304).
+
+        Args:
+            url: The full request URL including query string.
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+
+    def prune(self, max_age_hours, max_mb=None):
+        """Delete stale responses, then the least recently used over a size cap.
+
+        Args:
+            max_age_hours: Maximum age in hours of entries to keep.
+            max_mb: Optional cap in megabytes on the total size of cached
+                bodies; the least recently fetched entries beyond it are
+                deleted and the file is compacted.
+
+        Returns:
+            Number of entries deleted.
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM responses WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+            evict = []
+            if max_mb is not None:
+                budget = max_mb * 1024 * 1024
+                total = 0
+                for url, size in self._conn.execute(
+                    "SELECT url, length(body) FROM responses ORDER BY fetched_at DESC"
+                ):
+                    total += size or 0
+                    if total > budget:
+                        evict.append((url,))
+            if evict:
+                self._conn.executemany("DELETE FROM responses WHERE url = ?", evict)
+            self._conn.commit()
+            if evict:
+                # Hand freed pages back so the persisted cache file shrinks.
+                self._conn.execute("VACUUM")
+        return deleted + len(evict)
@@ -0,0 +1,80 @@
+"""On-disk cache of pull request line stats across runs.
+
+A PR's additions and deletions only change when the PR itself is updated,
+so the stats are stored in a small SQLite database keyed by repo and PR
+number together with the PR's updated_at. Later runs reuse the stored
+stats for every PR whose updated_at is unchanged and only ask GitHub for
+PRs that are new or were touched since.
+"""
+
+import os
+
+from tracker.store import SQLiteStore
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "pr_stats.sqlite")
+
+
+class PRStatsCache(SQLiteStore):
+    """SQLite-backed store of {(repo, number): (updated_at, additions, deletions)}."""
+
+    DEFAULT_PATH = DEFAULT_CACHE_PATH
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS pr_stats ("
+        "repo TEXT, number INTEGER, updated_at TEXT, "
+        "additions INTEGER, deletions INTEGER, "
+        "PRIMARY KEY (repo, number))"
+    )
+
+    def get_many(self, repo, prs):
+        """Look up cached stats for PRs that have not changed since caching.
+
+        Args:
+            repo: The base repo as "owner/repo".
+            prs: List of PR dicts from the GitHub API (number, updated_at).
+
+        Returns:
+            Dict mapping PR number to a dict with 'additions' and
+            'deletions', for PRs whose updated_at matches the cached entry.
+        """
+        if not prs:
+            return {}
+        updated = {pr["number"]: pr.get("updated_at") for pr in prs}
+        numbers = list(updated)
+        hits = {}
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for i in range(0, len(numbers), 500):
+                chunk = numbers[i:i + 500]
+                rows = self._conn.execute(
+                    "SELECT number, updated_at, additions, deletions FROM pr_stats "
+                    f"WHERE repo = ? AND number IN ({','.join('?' * len(chunk))})",
+                    [repo] + chunk,
+                ).fetchall()
+                for number, updated_at, additions, deletions in rows:
+                    if updated_at == updated[number]:
+                        hits[number] = {"additions": additions, "deletions": deletions}
+        return hits
+
+    def put_many(self, repo, prs, stats):
+        """Store freshly fetched stats for PRs.
+
+        Args:
+            repo: The base repo as "owner/repo".
+            prs: List of PR dicts the stats were fetched for.
+            stats: Dict mapping PR number to 'additions'/'deletions' dicts.
+                PRs missing from it are not stored.
+        """
+        rows = [
+            (repo, pr["number"], pr.get("updated_at", ""),
+             stats[pr["number"]].get("additions", 0), stats[pr["number"]].get("deletions", 0))
+            for pr in prs if pr["number"] in stats
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pr_stats (repo, number, updated_at, additions, deletions) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
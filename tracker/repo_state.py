@@ -0,0 +1,27 @@
+"""On-disk record of base repo PRs, issues, and comments for delta fetches.
+
+Stores the items last fetched from each base repo endpoint (pull requests,
+issues, issue comments, review comments), plus when they were fetched, in
+a small SQLite database. Later runs only ask GitHub for items updated since
+the previous run and merge them in by id, instead of paging through the
+whole history since bootcamp start every time. A full refetch is forced
+periodically so deleted items are eventually dropped.
+"""
+
+import os
+
+from tracker.store import FetchState
+
+DEFAULT_STATE_PATH = os.path.join(".cache", "repo_state.sqlite")
+
+
+class RepoState(FetchState):
+    """SQLite-backed store of {key: (since, full_at, fetched_at, items)}."""
+
+    DEFAULT_PATH = DEFAULT_STATE_PATH
+    TABLE = "items"
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS items ("
+        "key TEXT PRIMARY KEY, since TEXT, full_at TEXT, "
+        "fetched_at TEXT, items TEXT)"
+    )
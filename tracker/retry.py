@@ -0,0 +1,118 @@
+"""Retry with exponential backoff for GitHub and Google Sheets API calls.
+
+Retries rate-limit responses (429, or 403 with rate-limit signals),
+transient server errors, and connection failures. Honors Retry-After and
+X-RateLimit-Reset when the server provides them, otherwise backs off
+exponentially with jitter. Every wait is counted so scripts can report how
+much time a run lost to rate limits.
+"""
+
+import functools
+import random
+import threading
+import time
+
+import requests
+from gspread.exceptions import APIError
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (requests.HTTPError, requests.ConnectionError, requests.Timeout, APIError)
+
+_stats_lock = threading.Lock()
+_stats = {"waits": 0, "seconds": 0.0}
+
+
+def retry_stats():
+    """Return how many retry waits happened in this process and their total.
+
+    Returns:
+        Dict with 'waits' (count) and 'seconds' (total time slept).
+    """
+    with _stats_lock:
+        return dict(_stats)
+
+
+def print_retry_stats():
+    """Print a one-line summary of retry waits, if there were any."""
+    stats = retry_stats()
+    if stats["waits"]:
+        print(f"  Rate limits / transient errors: {stats['waits']} retries, "
+              f"{stats['seconds']:.1f}s spent waiting")
+
+
+def _retry_delay(exc, attempt, base, rate_limits_only=False):
+    """Compute how long to wait before retrying a failed call.
+
+    Args:
+        exc: The exception raised by the call.
+        attempt: Zero-based attempt number that just failed.
+        base: Base delay in seconds for exponential backoff.
+        rate_limits_only: Retry only rate-limit responses, which the server
+            rejected before doing any work. Used for non-idempotent calls.
+
+    Returns:
+        Seconds to sleep, or None if the error should not be retried.
+    """
+    backoff = base * 2 ** attempt + random.random() * 0.5
+    resp = getattr(exc, "response", None)
+    if resp is None:
+        # Connection errors and timeouts carry no response; the call may
+        # still have been applied, so only idempotent calls retry them.
+        return None if rate_limits_only else backoff
+
+    status = resp.status_code
+    headers = resp.headers
+    if status == 403:
+        rate_limited = (
+            "Retry-After" in headers
+            or headers.get("X-RateLimit-Remaining") == "0"
+            or "rate limit" in resp.text.lower()
+        )
+        if not rate_limited:
+            return None
+    elif status not in RETRY_STATUSES:
+        return None
+    elif rate_limits_only and status != 429:
+        return None
+
+    if "Retry-After" in headers:
+        try:
+            return float(headers["Retry-After"]) + random.random() * 0.5
+        except ValueError:
+            return backoff
+    if headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+        return max(int(headers["X-RateLimit-Reset"]) - time.time(), 1)
+    return backoff
+
+
+def retry_with_backoff(max_tries=6, base=1.0, rate_limits_only=False):
+    """Decorate a function to retry rate-limited and transient failures.
+
+    Args:
+        max_tries: Total number of attempts before the error is re-raised.
+        base: Base delay in seconds for exponential backoff.
+        rate_limits_only: Retry only rate-limit responses, not timeouts or
+            server errors (see _retry_delay).
+
+    Returns:
+        A decorator that wraps the target function.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_tries):
+                try:
+                    return fn(*args, **kwargs)
+                except RETRY_EXCEPTIONS as e:
+                    delay = _retry_delay(e, attempt, base, rate_limits_only)
+                    if delay is None or attempt == max_tries - 1:
+                        raise
+                    status = getattr(getattr(e, "response", None), "status_code", None)
+                    reason = f"HTTP {status}" if status else e.__class__.__name__
+                    print(f"  {fn.__name__} failed ({reason}), retrying in {delay:.1f}s...")
+                    with _stats_lock:
+                        _stats["waits"] += 1
+                        _stats["seconds"] += delay
+                    time.sleep(delay)
+        return wrapper
+    return decorator
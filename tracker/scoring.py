@@ -12,7 +12,61 @@ Quality: PR merge rate.
 from datetime import datetime, timezone
 
 
-def compute_scores(metrics, config, end_date=None):
+def bootcamp_start_date(config):
+    """Parse bootcamp_start_date from config, falling back to the default.
+
+    Args:
+        config: Dict of config key-value pairs from the Config sheet.
+
+    Returns:
+        The bootcamp start as a date object.
+    """
+    try:
+        return datetime.strptime(config.get("bootcamp_start_date", "2026-02-23"), "%Y-%m-%d").date()
+    except ValueError:
+        return datetime(2026, 2, 23).date()
+
+
+def scoring_params(config, end_date=None):
+    """Parse the scoring weights, caps, and thresholds from config once.
+
+    compute_scores is called for every learner (and every period), so
+    callers scoring a whole cohort parse the config here once and pass
+    the result to each compute_scores call.
+
+    Args:
+        config: Dict of config key-value pairs from the Config sheet.
+        end_date: Optional date object. When provided, total_days is computed
+            as end_date - bootcamp_start instead of today - bootcamp_start.
+
+    Returns:
+        Dict of numeric scoring parameters, including total_days.
+    """
+    bootcamp_start = bootcamp_start_date(config)
+    if end_date:
+        total_days = max((end_date - bootcamp_start).days, 1)
+    else:
+        total_days = max((datetime.now(timezone.utc).date() - bootcamp_start).days, 1)
+
+    return {
+        "consistency_max": float(config.get("consistency_max_points", 30)),
+        "collaboration_max": float(config.get("collaboration_max_points", 25)),
+        "code_volume_max": float(config.get("code_volume_max_points", 25)),
+        "quality_max": float(config.get("quality_max_points", 20)),
+        "pr_pts": float(config.get("pr_points_each", 2)),
+        "review_pts": float(config.get("review_points_each", 1.5)),
+        "collab_pr_cap": float(config.get("collab_pr_cap", 15)),
+        "collab_review_cap": float(config.get("collab_review_cap", 10)),
+        "lines_added_scale": float(config.get("lines_added_max_scale", 500)),
+        "classify_excellent": float(config.get("classify_excellent", 80)),
+        "classify_good": float(config.get("classify_good", 60)),
+        "classify_average": float(config.get("classify_average", 40)),
+        "classify_needs_improvement": float(config.get("classify_needs_improvement", 20)),
+        "total_days": total_days,
+    }
+
+
+def compute_scores(metrics, config, end_date=None, params=None):
     """Compute four component scores, total score, and classification.
 
     All scoring parameters (weights, caps, scales, thresholds) are read
@@ -24,69 +78,48 @@ def compute_scores(metrics, config, end_date=None):
         config: Dict of config key-value pairs from the Config sheet.
         end_date: Optional date object. When provided, total_days is computed
             as end_date - bootcamp_start instead of today - bootcamp_start.
+        params: Optional result of scoring_params(config, end_date); when
+            given, config and end_date are not re-parsed.
 
     Returns:
         Dict with keys: consistency, collaboration, code_volume, quality,
         total_score, classification.
     """
     m = metrics
+    p = params if params is not None else scoring_params(config, end_date)
 
-    consistency_max = float(config.get("consistency_max_points", 30))
-    collaboration_max = float(config.get("collaboration_max_points", 25))
-    code_volume_max = float(config.get("code_volume_max_points", 25))
-    quality_max = float(config.get("quality_max_points", 20))
-
-    pr_pts = float(config.get("pr_points_each", 2))
-    review_pts = float(config.get("review_points_each", 1.5))
-    collab_pr_cap = float(config.get("collab_pr_cap", 15))
-    collab_review_cap = float(config.get("collab_review_cap", 10))
-
-    lines_added_scale = float(config.get("lines_added_max_scale", 500))
-
-    quality_max_points = float(config.get("quality_max_points", 20))
-
-    classify_excellent = float(config.get("classify_excellent", 80))
-    classify_good = float(config.get("classify_good", 60))
-    classify_average = float(config.get("classify_average", 40))
-    classify_needs_improvement = float(config.get("classify_needs_improvement", 20))
+    consistency_max = p["consistency_max"]
+    collaboration_max = p["collaboration_max"]
+    code_volume_max = p["code_volume_max"]
+    quality_max = p["quality_max"]
 
     # --- Consistency: daily PR activity ratio ---
-    bootcamp_start_str = config.get("bootcamp_start_date", "2026-02-23")
-    try:
-        bootcamp_start = datetime.strptime(bootcamp_start_str, "%Y-%m-%d").date()
-    except ValueError:
-        bootcamp_start = datetime(2026, 2, 23).date()
-    if end_date:
-        total_days = max((end_date - bootcamp_start).days, 1)
-    else:
-        total_days = max((datetime.now(timezone.utc).date() - bootcamp_start).days, 1)
-
     pr_active_days = m.get("pr_active_days", 0)
-    pr_active_ratio = min(1.0, pr_active_days / total_days)
+    pr_active_ratio = min(1.0, pr_active_days / p["total_days"])
     consistency = min(consistency_max, round(pr_active_ratio * consistency_max, 1))
 
     # --- Collaboration: PRs opened + code reviews given ---
-    collab_prs = min(collab_pr_cap, m["prs_opened"] * pr_pts)
-    collab_reviews = min(collab_review_cap, m["comments_given"] * review_pts)
+    collab_prs = min(p["collab_pr_cap"], m["prs_opened"] * p["pr_pts"])
+    collab_reviews = min(p["collab_review_cap"], m["comments_given"] * p["review_pts"])
     collaboration = min(collaboration_max, round(collab_prs + collab_reviews, 1))
 
     # --- Code Volume: lines added only ---
-    added_score = min(code_volume_max, m["lines_added"] / lines_added_scale * code_volume_max)
+    added_score = min(code_volume_max, m["lines_added"] / p["lines_added_scale"] * code_volume_max)
     code_volume = min(code_volume_max, round(added_score, 1))
 
     # --- Quality: merge rate only ---
     merge_rate = (m["prs_merged"] / m["prs_opened"]) if m["prs_opened"] > 0 else 0
-    quality = min(quality_max, round(merge_rate * quality_max_points, 1))
+    quality = min(quality_max, round(merge_rate * quality_max, 1))
 
     total_score = round(consistency + collaboration + code_volume + quality, 1)
 
-    if total_score >= classify_excellent:
+    if total_score >= p["classify_excellent"]:
         classification = "EXCELLENT"
-    elif total_score >= classify_good:
+    elif total_score >= p["classify_good"]:
         classification = "GOOD"
-    elif total_score >= classify_average:
+    elif total_score >= p["classify_average"]:
         classification = "AVERAGE"
-    elif total_score >= classify_needs_improvement:
+    elif total_score >= p["classify_needs_improvement"]:
         classification = "NEEDS IMPROVEMENT"
     else:
         classification = "AT RISK"
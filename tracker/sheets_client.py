@@ -2,6 +2,10 @@
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.http_client import HTTPClient
+
+from tracker.constants import TIMESTAMP_FORMAT
+from tracker.retry import retry_with_backoff
 
 
 SCOPES = [
@@ -9,6 +13,70 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# Ranges per batch_update request; keeps each payload far below the API cap.
+BATCH_UPDATE_CHUNK = 100
+
+
+def column_letter(n):
+    """Convert a 1-based column number to its A1 letters (1 -> A, 27 -> AA).
+
+    Args:
+        n: Column number, starting at 1.
+
+    Returns:
+        The column letters.
+    """
+    letters = ""
+    while n:
+        n, r = divmod(n - 1, 26)
+        letters = chr(65 + r) + letters
+    return letters
+
+
+def _is_idempotent(endpoint, json):
+    """Tell whether repeating a Sheets/Drive request is harmless.
+
+    values:append adds rows wherever the table ends and addSheet creates a
+    tab, so a retry after a timeout or 5xx that was in fact applied would
+    duplicate rows or fail on the existing tab. Reads, values updates and
+    other batchUpdate requests write the same result when repeated.
+
+    Args:
+        endpoint: Request URL.
+        json: Request body, if any.
+
+    Returns:
+        True if the request can be retried on any transient error.
+    """
+    if ":append" in endpoint:
+        return False
+    batch = (json or {}).get("requests") or []
+    return not any("addSheet" in r for r in batch)
+
+
+class _RetryingHTTPClient(HTTPClient):
+    """gspread transport that retries every Sheets/Drive request.
+
+    Applying retry_with_backoff at the request level covers all gspread
+    calls (reads, updates, formatting batches), not only the ones wrapped
+    in this module, so one rate-limit burst does not end the run.
+    Non-idempotent requests are retried on rate limits only.
+    """
+
+    def request(self, method, endpoint, *args, **kwargs):
+        """Send one API request, retrying rate limits and transient errors."""
+        if _is_idempotent(endpoint, kwargs.get("json")):
+            return self._request(method, endpoint, *args, **kwargs)
+        return self._request_once(method, endpoint, *args, **kwargs)
+
+    @retry_with_backoff()
+    def _request(self, *args, **kwargs):
+        return super().request(*args, **kwargs)
+
+    @retry_with_backoff(rate_limits_only=True)
+    def _request_once(self, *args, **kwargs):
+        return super().request(*args, **kwargs)
+
 
 class SheetsClient:
     """Wrapper around gspread for spreadsheet operations.
@@ -26,9 +94,11 @@ class SheetsClient:
         """
         self.service_account_email = credentials_info.get("client_email", "")
         creds = Credentials.from_service_account_info(credentials_info, scopes=SCOPES)
-        self.gc = gspread.authorize(creds)
+        self.gc = gspread.authorize(creds, http_client=_RetryingHTTPClient)
         self.spreadsheet = self.gc.open_by_key(sheet_id)
         self._row_cache = {}
+        self._headers_verified = set()
+        self._config_rows = None
 
     def get_worksheet(self, tab_name):
         """Get an existing worksheet by name, or create it if missing.
@@ -91,26 +161,70 @@ class SheetsClient:
         self.spreadsheet.reorder_worksheets(ordered)
 
     def load_rows(self, worksheet):
-        """Load all rows into an internal cache for fast lookups.
+        """Load the Username/Date key columns into an internal row cache.
 
         Populates a (worksheet_id, username, date) -> row_number cache
         so that find_row and ensure_row can operate without additional
-        API calls.
+        API calls. Only columns A:B are read, not the whole sheet.
 
         Args:
             worksheet: A gspread Worksheet object.
 
         Returns:
-            List of all row values (including headers).
+            List of [username, date] rows (including headers).
         """
-        all_values = worksheet.get_all_values()
-        self._row_cache_data = all_values
+        key_values = worksheet.get("A1:B")
         self._row_cache_ws_id = id(worksheet)
-        self._row_count = len(all_values)
-        for i, row in enumerate(all_values):
+        self._row_count = len(key_values)
+        self._first_cell = key_values[0][0] if key_values and key_values[0] else ""
+        for i, row in enumerate(key_values):
             if len(row) >= 2 and row[0]:
                 self._row_cache[(id(worksheet), row[0].lower(), row[1])] = i + 1
-        return all_values
+        return key_values
+
+    def ensure_rows_loaded(self, worksheet):
+        """Load the row cache for a worksheet unless it is already loaded.
+
+        Args:
+            worksheet: A gspread Worksheet object.
+        """
+        if getattr(self, "_row_cache_ws_id", None) != id(worksheet):
+            self.load_rows(worksheet)
+
+    def forget_rows(self, worksheet):
+        """Drop the cached row positions of a worksheet.
+
+        Call after anything that moves rows (such as a sort), so the next
+        find_row/ensure_row reloads the key columns instead of writing to
+        stale row numbers.
+
+        Args:
+            worksheet: A gspread Worksheet object.
+        """
+        ws_id = id(worksheet)
+        self._row_cache = {k: v for k, v in self._row_cache.items() if k[0] != ws_id}
+        if getattr(self, "_row_cache_ws_id", None) == ws_id:
+            self._row_cache_ws_id = None
+
+    def ensure_headers(self, worksheet, headers):
+        """Write the header row if the worksheet does not start with it.
+
+        Checks cell A1 from the row cache (loading it if needed) instead of
+        issuing a separate read of row 1, and remembers verified worksheets
+        so repeat calls make no API requests.
+
+        Args:
+            worksheet: A gspread Worksheet object.
+            headers: List of header strings for row 1.
+        """
+        if id(worksheet) in self._headers_verified:
+            return
+        self.ensure_rows_loaded(worksheet)
+        if self._first_cell != headers[0]:
+            worksheet.update(values=[headers], range_name="A1")
+            self._first_cell = headers[0]
+            self._row_count = max(self._row_count, 1)
+        self._headers_verified.add(id(worksheet))
 
     def find_row(self, worksheet, username, date_str):
         """Find the row number for a learner+date combo from cache.
@@ -144,16 +258,21 @@ class SheetsClient:
         self._row_cache[(id(worksheet), username.lower(), date_str)] = next_row
         return next_row
 
-    def batch_update(self, worksheet, updates):
+    def batch_update(self, worksheet, updates, chunk_size=BATCH_UPDATE_CHUNK):
         """Batch update cells on a worksheet.
 
+        Large update lists are sent in chunks so a single request stays well
+        under the Sheets payload limit; each chunk is its own request (and
+        retried on its own), so a rate limit midway does not resend the
+        chunks already written.
+
         Args:
             worksheet: A gspread Worksheet object.
             updates: List of dicts with 'range' and 'values' keys.
+            chunk_size: Maximum number of ranges per request.
         """
-        if not updates:
-            return
-        worksheet.batch_update(updates)
+        for i in range(0, len(updates), chunk_size):
+            worksheet.batch_update(updates[i:i + chunk_size])
 
     def write_all_rows(self, worksheet, headers, rows):
         """Write headers and all data rows in one API call.
@@ -164,7 +283,7 @@ class SheetsClient:
             rows: List of row lists.
         """
         data = [headers] + rows
-        worksheet.update(values=data, range_name=f"A1:{chr(64+len(headers))}{len(data)}")
+        worksheet.update(values=data, range_name=f"A1:{column_letter(len(headers))}{len(data)}")
 
     def clear_and_write(self, worksheet, headers, rows):
         """Clear the worksheet then write headers and rows.
@@ -178,26 +297,54 @@ class SheetsClient:
         """
         worksheet.clear()
         if not rows:
-            worksheet.update(values=[headers], range_name=f"A1:{chr(64+len(headers))}1")
+            worksheet.update(values=[headers], range_name=f"A1:{column_letter(len(headers))}1")
             return
         data = [headers] + rows
-        col_letter = chr(64 + len(headers)) if len(headers) <= 26 else "Z"
+        col_letter = column_letter(len(headers))
         worksheet.update(values=data, range_name=f"A1:{col_letter}{len(data)}")
 
     def read_config(self):
         """Read the Config tab into a key-value dict.
 
+        Also remembers the row of each key so update_config can write a
+        value back without reading the tab again.
+
         Returns:
             Dict mapping config keys to their string values.
         """
         ws = self.get_worksheet("Config")
         rows = ws.get_all_values()
         config = {}
-        for row in rows:
+        self._config_rows = {}
+        for i, row in enumerate(rows):
             if len(row) >= 2 and row[0]:
                 config[row[0].strip()] = row[1].strip()
+            if row and row[0].strip():
+                self._config_rows.setdefault(row[0].strip(), i + 1)
         return config
 
+    def update_config(self, key, value):
+        """Set the value of an existing key on the Config tab.
+
+        Uses the key rows remembered by read_config, so only the one cell
+        is written; the tab is read first if read_config has not run. Keys
+        that are not on the tab are left alone.
+
+        Args:
+            key: The config key in column A.
+            value: The new value for column B.
+
+        Returns:
+            True if the key was found and updated, False otherwise.
+        """
+        if self._config_rows is None:
+            self.read_config()
+        row = self._config_rows.get(key)
+        if row is None:
+            return False
+        self.get_worksheet("Config").update_cell(row, 2, value)
+        return True
+
     def update_timestamp(self, worksheet, row, col):
         """Set a cell to the current UTC timestamp.
 
@@ -208,5 +355,5 @@ class SheetsClient:
         """
         from datetime import datetime, timezone
 
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        now = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
         worksheet.update_cell(row, col, now)
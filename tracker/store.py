@@ -0,0 +1,99 @@
+"""Shared SQLite plumbing for the on-disk stores under .cache/.
+
+The HTTP cache, commit and repo state, and line stats caches each keep one
+small SQLite database. SQLiteStore opens it, creates its table, and hands
+subclasses a connection plus the lock that guards it; subclasses only
+define their schema and get/put methods. FetchState adds the shared
+get/put for the commit and repo delta-fetch state.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+    """Base class for a single-table SQLite store.
+
+    Safe to share across threads: all access goes through one connection
+    guarded by a lock. Subclasses set DEFAULT_PATH and SCHEMA (a
+    CREATE TABLE IF NOT EXISTS statement) and may override _migrate.
+    """
+
+    DEFAULT_PATH = None
+    SCHEMA = None
+
+    def __init__(self, path=None):
+        """Open (or create) the database and ensure its table exists.
+
+        Args:
+            path: Filesystem path of the SQLite database file (defaults to
+                the subclass's DEFAULT_PATH).
+        """
+        path = path or self.DEFAULT_PATH
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(self.SCHEMA)
+            self._migrate()
+            self._conn.commit()
+
+    def _migrate(self):
+        """Upgrade tables created by older versions (called under the lock)."""
+
+
+class FetchState(SQLiteStore):
+    """Base class for stores of fetched data kept for delta fetches.
+
+    Each key maps to the fetch's lower bound (since), when the last full
+    and the last fetch of any kind ran, and the fetched data, stored as
+    JSON in a column named after TABLE. Subclasses set TABLE and a SCHEMA
+    with the columns key, since, full_at, fetched_at and TABLE.
+    """
+
+    TABLE = None
+
+    def get(self, key):
+        """Look up the stored data for a key.
+
+        Args:
+            key: Identifier of what was fetched, e.g. "owner/repo:prs".
+
+        Returns:
+            Dict with since, full_at, fetched_at (ISO timestamps) and the
+            decoded data under TABLE, or None if nothing is stored.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT since, full_at, fetched_at, {self.TABLE} FROM {self.TABLE} WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        since, full_at, fetched_at, data = row
+        return {
+            "since": since, "full_at": full_at,
+            "fetched_at": fetched_at, self.TABLE: json.loads(data),
+        }
+
+    def put(self, key, since, full_at, fetched_at, data):
+        """Store or replace the data for a key.
+
+        Args:
+            key: Identifier of what was fetched, e.g. "owner/repo:prs".
+            since: The lower bound (ISO timestamp, or "") the data covers.
+            full_at: When the last full (non-incremental) fetch ran.
+            fetched_at: When the data was last fetched.
+            data: JSON-serializable data as fetched.
+        """
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE} "
+                f"(key, since, full_at, fetched_at, {self.TABLE}) VALUES (?, ?, ?, ?, ?)",
+                (key, since, full_at, fetched_at, json.dumps(data)),
+            )
+            self._conn.commit()
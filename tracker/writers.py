@@ -4,7 +4,9 @@ Each function reads data, transforms it, and writes to the appropriate
 Google Sheets tab via the SheetsClient.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
 from tracker.constants import (
     DAILY_HEADERS,
@@ -15,17 +17,58 @@ from tracker.constants import (
     EXTERNAL_GROUP_TABS,
     EXTERNAL_GROUP_HEADERS,
     EXTERNAL_PERIOD_HEADERS,
+    TIMESTAMP_FORMAT,
 )
 from tracker.fetchers import fetch_base_repo_data, fetch_learner_day, fetch_learner_alltime, compute_period_metrics
-from tracker.scoring import compute_scores
+from tracker.scoring import bootcamp_start_date, compute_scores, scoring_params
+from tracker.sheets_client import column_letter
 
+# Per-learner fetches are network-bound; overlap them across this many threads.
+MAX_LEARNER_WORKERS = 16
 
-def write_daily_metrics(gh, sheets, ws, learners, base_repos, date_str):
+
+def learner_workers(config):
+    """Read the per-learner fetch concurrency from config.
+
+    Args:
+        config: Config dict from the Config sheet.
+
+    Returns:
+        The learner_concurrency value as a positive int, or
+        MAX_LEARNER_WORKERS if it is unset or invalid.
+    """
+    try:
+        return max(1, int(config.get("learner_concurrency", MAX_LEARNER_WORKERS)))
+    except (TypeError, ValueError):
+        return MAX_LEARNER_WORKERS
+
+
+def _fetch_all_learners(fetch_fn, learners, workers=None):
+    """Run a per-learner fetch function concurrently, preserving input order.
+
+    Args:
+        fetch_fn: Callable taking a learner dict and returning its metrics.
+        learners: List of learner dicts.
+        workers: Maximum concurrent learners (default MAX_LEARNER_WORKERS).
+
+    Returns:
+        List of (learner, metrics) tuples in the same order as learners.
+    """
+    workers = max(1, min(workers or MAX_LEARNER_WORKERS, len(learners)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(fetch_fn, learners))
+    return list(zip(learners, results))
+
+
+def write_daily_metrics(gh, sheets, ws, learners, base_repos, date_str, base_repo_data=None,
+                        workers=None, stats_cache=None):
     """Fetch metrics for a single day and write rows to Daily Raw Metrics.
 
     For each learner, fetches commit counts, PRs, issues, comments,
     line stats, merge times, and rejection rates, then batch-writes
     all rows to the worksheet (updating existing rows or appending new ones).
+    Existing row positions are read once per worksheet into the
+    SheetsClient row cache and reused across calls.
 
     Args:
         gh: GitHubClient instance.
@@ -34,16 +77,27 @@ def write_daily_metrics(gh, sheets, ws, learners, base_repos, date_str):
         learners: List of learner dicts with username, fork_repo, base_repo.
         base_repos: List of "owner/repo" strings.
         date_str: Date string in YYYY-MM-DD format.
+        base_repo_data: Optional pre-fetched data from fetch_base_repo_data.
+            When omitted, base repo data is fetched for date_str.
+        workers: Maximum concurrent learner fetches (default MAX_LEARNER_WORKERS).
+        stats_cache: Optional CommitStatsCache for commit line stats.
     """
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    since = f"{date_str}T00:00:00Z"
+    now = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
 
-    base_repo_data = fetch_base_repo_data(gh, base_repos, since=since)
+    if base_repo_data is None:
+        since = f"{date_str}T00:00:00Z"
+        base_repo_data = fetch_base_repo_data(
+            gh, base_repos, since=since, include_review_comments=True
+        )
 
-    all_row_data = []
-    for learner in learners:
-        m = fetch_learner_day(gh, learner, base_repo_data, date_str)
+    results = _fetch_all_learners(
+        lambda learner: fetch_learner_day(gh, learner, base_repo_data, date_str, stats_cache),
+        learners,
+        workers=workers,
+    )
 
+    all_row_data = []
+    for learner, m in results:
         has_activity = any([
             m["commits"], m["prs_opened"], m["prs_merged"], m["issues_opened"],
             m["issue_comments"], m["review_comments_given"],
@@ -61,53 +115,124 @@ def write_daily_metrics(gh, sheets, ws, learners, base_repos, date_str):
         print(f"  {learner['username']} ({date_str}): {m['commits']} commits, +{m['lines_added']}/-{m['lines_deleted']}, {m['prs_opened']} PRs")
 
     if all_row_data:
-        existing_data = ws.get_all_values()
-        existing_map = {}
-        for i, row in enumerate(existing_data[1:], start=2):
-            if len(row) >= 2:
-                existing_map[(row[0].lower(), row[1])] = i
-
-        updates = []
-        next_row = len(existing_data) + 1
-        for row_data in all_row_data:
-            key = (row_data[0].lower(), row_data[1])
-            if key in existing_map:
-                r = existing_map[key]
-            else:
-                r = next_row
-                next_row += 1
-            updates.append({"range": f"A{r}:M{r}", "values": [row_data]})
-
-        if next_row - 1 > ws.row_count:
-            ws.add_rows(next_row - 1 - ws.row_count)
-
-        ws.batch_update(updates)
-        print(f"  Wrote {len(updates)} rows to Daily Raw Metrics")
-
-
-def sort_daily_raw_metrics(ws):
-    """Sort Daily Raw Metrics by Date DESC, then Username ASC.
+        updated, added = upsert_daily_rows(sheets, ws, all_row_data)
+        print(f"  Wrote {updated} updated and {added} new rows to Daily Raw Metrics")
+
 
-    Uses a two-pass stable sort: secondary key (Username ASC) first,
-    then primary key (Date DESC).
+def upsert_daily_rows(sheets, ws, rows):
+    """Write Daily Raw Metrics rows, updating existing ones in place.
+
+    Row positions come from the SheetsClient row cache, which reads the
+    key columns (A1:B) once and tracks rows appended by earlier calls.
+    Rows already in the sheet are rewritten with coalesced range updates;
+    the rest go out in a single append. INSERT_ROWS inserts them directly
+    below the table that starts at A1 (growing the grid as needed) rather
+    than overwriting blank grid rows, so they land where the row cache
+    expects them.
 
     Args:
+        sheets: SheetsClient instance.
         ws: The Daily Raw Metrics worksheet object.
+        rows: List of row lists in DAILY_HEADERS order.
+
+    Returns:
+        Tuple of (rows updated, rows appended).
     """
-    print("\nSorting Daily Raw Metrics...")
-    all_data = ws.get_all_values()
-    if len(all_data) <= 1:
-        return
-    headers = all_data[0]
-    rows = all_data[1:]
+    sheets.ensure_rows_loaded(ws)
+
+    row_writes = {}
+    new_rows = {}
+    for row_data in rows:
+        key = (row_data[0].lower(), row_data[1])
+        row_num = sheets.find_row(ws, row_data[0], row_data[1])
+        if row_num and key not in new_rows:
+            row_writes[row_num] = row_data
+        else:
+            sheets.ensure_row(ws, row_data[0], row_data[1])
+            new_rows[key] = row_data
+
+    if row_writes:
+        sheets.batch_update(ws, coalesce_row_updates(row_writes, "M"))
+    if new_rows:
+        ws.append_rows(
+            list(new_rows.values()),
+            value_input_option="RAW",
+            insert_data_option="INSERT_ROWS",
+            table_range="A1",
+        )
+    return len(row_writes), len(new_rows)
+
 
-    rows.sort(key=lambda r: r[0].lower() if r else "")
-    rows.sort(key=lambda r: r[1] if len(r) > 1 else "", reverse=True)
+def coalesce_row_updates(row_writes, last_col):
+    """Merge writes to consecutive rows into contiguous range updates.
 
-    data = [headers] + rows
-    col = chr(64 + len(headers)) if len(headers) <= 26 else "Z"
-    ws.update(values=data, range_name=f"A1:{col}{len(data)}")
-    print(f"  Sorted {len(rows)} rows")
+    New rows are appended at the end of the sheet, so a day's (or a
+    backfill's) writes usually collapse into a single
+    A{first}:{last_col}{last} range.
+
+    Args:
+        row_writes: Dict mapping row number (1-indexed) to a row values list.
+        last_col: Letter of the last column written (e.g. "M").
+
+    Returns:
+        List of dicts with 'range' and 'values' keys for batch_update.
+    """
+    updates = []
+    block = []
+    start = prev = None
+    for r in sorted(row_writes):
+        if block and r != prev + 1:
+            updates.append({"range": f"A{start}:{last_col}{prev}", "values": block})
+            block = []
+        if not block:
+            start = r
+        block.append(row_writes[r])
+        prev = r
+    if block:
+        updates.append({"range": f"A{start}:{last_col}{prev}", "values": block})
+    return updates
+
+
+def sort_daily_raw_metrics(ws, read_back=False, sheets=None):
+    """Sort Daily Raw Metrics by Date DESC, then Username ASC.
+
+    Sends a single sortRange request so Sheets sorts the rows server-side,
+    instead of downloading the tab, sorting it locally and writing it back.
+    Sheets compares text case-insensitively, matching the former
+    lowercased username key.
+
+    Args:
+        ws: The Daily Raw Metrics worksheet object.
+        read_back: If True, read the sorted tab once afterwards and return it.
+        sheets: Optional SheetsClient whose row cache for ws is cleared,
+            since the sort moves rows away from their cached positions.
+
+    Returns:
+        With read_back, the sorted sheet contents (header row first), so
+        later readers can reuse them instead of reading the tab again;
+        otherwise None.
+    """
+    print("\nSorting Daily Raw Metrics...")
+    ws.spreadsheet.batch_update({"requests": [{
+        "sortRange": {
+            "range": {
+                "sheetId": ws.id,
+                "startRowIndex": 1,
+                "startColumnIndex": 0,
+                "endColumnIndex": ws.col_count,
+            },
+            "sortSpecs": [
+                {"dimensionIndex": 1, "sortOrder": "DESCENDING"},
+                {"dimensionIndex": 0, "sortOrder": "ASCENDING"},
+            ],
+        }
+    }]})
+    print("  Sorted server-side")
+    if sheets is not None:
+        sheets.forget_rows(ws)
+    if read_back:
+        return ws.get_all_values()
+    return None
 
 
 def _build_leaderboard_row(username, m, scores):
@@ -145,7 +270,32 @@ def _build_leaderboard_row(username, m, scores):
     }
 
 
-def update_leaderboard(gh, sheets, learners, base_repos, config, periods=None):
+# Leaderboard row fields in LEADERBOARD_HEADERS order (after Rank).
+_leaderboard_fields = itemgetter(
+    "username", "classification", "total_score",
+    "consistency", "collaboration", "code_volume", "quality",
+    "active_days", "total_commits", "prs_opened", "prs_merged",
+    "lines_added", "lines_deleted", "comments_received",
+    "comments_given", "avg_merge_time", "rejection_rate",
+    "last_active", "last_comment",
+)
+
+
+def _rank_leaderboard_rows(rows):
+    """Sort leaderboard row dicts by score (in place) and flatten to sheet rows.
+
+    Args:
+        rows: List of row dicts from _build_leaderboard_row.
+
+    Returns:
+        List of sheet rows, each starting with its 1-based rank.
+    """
+    rows.sort(key=itemgetter("total_score"), reverse=True)
+    return [[rank, *_leaderboard_fields(r)] for rank, r in enumerate(rows, start=1)]
+
+
+def update_leaderboard(gh, sheets, learners, base_repos, config, periods=None, commit_state=None,
+                       base_repo_data=None, pr_cache=None):
     """Fetch all-time data, compute scores, and write to the Leaderboard tab.
 
     Also computes period leaderboards (weekly, monthly) from the same API data
@@ -159,22 +309,23 @@ def update_leaderboard(gh, sheets, learners, base_repos, config, periods=None):
         config: Config dict from the Config sheet.
         periods: Optional dict mapping period name to (start_date, end_date).
             E.g. {"weekly": ("2026-03-30", "2026-04-02"), "monthly": ("2026-04-01", "2026-04-02")}
+        commit_state: Optional CommitState for incremental fork commit fetches.
+        base_repo_data: Optional pre-fetched data from fetch_base_repo_data,
+            covering at least bootcamp start onwards with review comments.
+            When omitted, it is fetched here.
+        pr_cache: Optional PRStatsCache for PR line stats across runs.
 
     Returns:
         Tuple of (leaderboard_rows, period_results) where period_results is a
         dict mapping period name to list of leaderboard row dicts.
     """
     print("\nUpdating Leaderboard...")
-    bootcamp_start_str = config.get("bootcamp_start_date", "2026-02-23")
-    try:
-        bootcamp_start = datetime.strptime(bootcamp_start_str, "%Y-%m-%d").date()
-    except ValueError:
-        bootcamp_start = datetime(2026, 2, 23).date()
-    bootcamp_start_iso = f"{bootcamp_start.isoformat()}T00:00:00Z"
+    bootcamp_start_iso = f"{bootcamp_start_date(config).isoformat()}T00:00:00Z"
 
-    base_repo_data = fetch_base_repo_data(
-        gh, base_repos, since=bootcamp_start_iso, include_review_comments=True
-    )
+    if base_repo_data is None:
+        base_repo_data = fetch_base_repo_data(
+            gh, base_repos, since=bootcamp_start_iso, include_review_comments=True
+        )
 
     if periods is None:
         periods = {}
@@ -183,36 +334,39 @@ def update_leaderboard(gh, sheets, learners, base_repos, config, periods=None):
     # Accumulate per-period rows: {period_name: [row_dicts]}
     period_rows = {name: [] for name in periods}
 
-    for learner in learners:
+    print(f"  Fetching all-time data for {len(learners)} learners...")
+    results = _fetch_all_learners(
+        lambda learner: fetch_learner_alltime(
+            gh, learner, base_repo_data, config=config, commit_state=commit_state,
+            pr_cache=pr_cache,
+        ),
+        learners,
+        workers=learner_workers(config),
+    )
+
+    # Parse scoring config once for the cohort, and once per period.
+    params = scoring_params(config)
+    period_params = {}
+    for name, (p_start, p_end) in periods.items():
+        period_config = dict(config)
+        period_config["bootcamp_start_date"] = p_start
+        p_end_date = datetime.strptime(p_end, "%Y-%m-%d").date()
+        period_params[name] = scoring_params(period_config, end_date=p_end_date)
+
+    for learner, m in results:
         username = learner["username"]
-        print(f"  Fetching all-time data for {username}...")
-        m = fetch_learner_alltime(gh, learner, base_repo_data, config=config)
-        scores = compute_scores(m, config)
+        scores = compute_scores(m, config, params=params)
 
         leaderboard_rows.append(_build_leaderboard_row(username, m, scores))
         print(f"    {username}: score={scores['total_score']}, {scores['classification']}")
 
         # Compute period metrics from the same raw data
         for name, (p_start, p_end) in periods.items():
-            p_end_date = datetime.strptime(p_end, "%Y-%m-%d").date()
             pm = compute_period_metrics(m, p_start, p_end)
-            period_config = dict(config)
-            period_config["bootcamp_start_date"] = p_start
-            p_scores = compute_scores(pm, period_config, end_date=p_end_date)
+            p_scores = compute_scores(pm, config, params=period_params[name])
             period_rows[name].append(_build_leaderboard_row(username, pm, p_scores))
 
-    leaderboard_rows.sort(key=lambda r: r["total_score"], reverse=True)
-
-    sheet_rows = []
-    for rank, r in enumerate(leaderboard_rows, start=1):
-        sheet_rows.append([
-            rank, r["username"], r["classification"], r["total_score"],
-            r["consistency"], r["collaboration"], r["code_volume"], r["quality"],
-            r["active_days"], r["total_commits"], r["prs_opened"], r["prs_merged"],
-            r["lines_added"], r["lines_deleted"], r["comments_received"],
-            r["comments_given"], r["avg_merge_time"], r["rejection_rate"],
-            r["last_active"], r["last_comment"],
-        ])
+    sheet_rows = _rank_leaderboard_rows(leaderboard_rows)
 
     lb_ws = sheets.get_worksheet("Leaderboard")
     sheets.clear_and_write(lb_ws, LEADERBOARD_HEADERS, sheet_rows)
@@ -220,18 +374,7 @@ def update_leaderboard(gh, sheets, learners, base_repos, config, periods=None):
 
     # Write period leaderboards
     for name, (p_start, p_end) in periods.items():
-        rows = period_rows[name]
-        rows.sort(key=lambda r: r["total_score"], reverse=True)
-        s_rows = []
-        for rank, r in enumerate(rows, start=1):
-            s_rows.append([
-                rank, r["username"], r["classification"], r["total_score"],
-                r["consistency"], r["collaboration"], r["code_volume"], r["quality"],
-                r["active_days"], r["total_commits"], r["prs_opened"], r["prs_merged"],
-                r["lines_added"], r["lines_deleted"], r["comments_received"],
-                r["comments_given"], r["avg_merge_time"], r["rejection_rate"],
-                r["last_active"], r["last_comment"],
-            ])
+        s_rows = _rank_leaderboard_rows(period_rows[name])
         tab_name = name.replace("_", " ").title()
         pw = sheets.get_worksheet(tab_name)
         sheets.clear_and_write(pw, LEADERBOARD_HEADERS, s_rows)
@@ -258,7 +401,8 @@ def write_period_leaderboard(sheets, raw_ws, config, tab_name, start_date, end_d
             appear in the leaderboard (those without activity get 0 scores).
     """
     print(f"\nWriting {tab_name} ({start_date} to {end_date})...")
-    all_data = raw_ws.get_all_values()
+    # Columns A..K (Username through PR Avg Merge Time) are all that is used.
+    all_data = raw_ws.get_all_values("A1:K")
     if len(all_data) <= 1:
         print(f"  No data in Daily Raw Metrics for {tab_name}")
         return
@@ -377,6 +521,7 @@ def write_period_leaderboard(sheets, raw_ws, config, tab_name, start_date, end_d
     # Build metrics and score each learner
     period_config = dict(config)
     period_config["bootcamp_start_date"] = start_date
+    params = scoring_params(period_config, end_date=period_end)
 
     leaderboard_rows = []
     for username, ld in learner_data.items():
@@ -414,7 +559,7 @@ def write_period_leaderboard(sheets, raw_ws, config, tab_name, start_date, end_d
             "last_comment": "",
         }
 
-        scores = compute_scores(metrics, period_config, end_date=period_end)
+        scores = compute_scores(metrics, period_config, params=params)
 
         mt = avg_merge_time
         if mt == 0:
@@ -450,18 +595,7 @@ def write_period_leaderboard(sheets, raw_ws, config, tab_name, start_date, end_d
             "last_comment": "",
         })
 
-    leaderboard_rows.sort(key=lambda r: r["total_score"], reverse=True)
-
-    sheet_rows = []
-    for rank, r in enumerate(leaderboard_rows, start=1):
-        sheet_rows.append([
-            rank, r["username"], r["classification"], r["total_score"],
-            r["consistency"], r["collaboration"], r["code_volume"], r["quality"],
-            r["active_days"], r["total_commits"], r["prs_opened"], r["prs_merged"],
-            r["lines_added"], r["lines_deleted"], r["comments_received"],
-            r["comments_given"], r["avg_merge_time"], r["rejection_rate"],
-            r["last_active"], r["last_comment"],
-        ])
+    sheet_rows = _rank_leaderboard_rows(leaderboard_rows)
 
     lb_ws = sheets.get_worksheet(tab_name)
     sheets.clear_and_write(lb_ws, LEADERBOARD_HEADERS, sheet_rows)
@@ -470,7 +604,7 @@ def write_period_leaderboard(sheets, raw_ws, config, tab_name, start_date, end_d
     return leaderboard_rows
 
 
-def write_daily_view(sheets, raw_ws):
+def write_daily_view(sheets, raw_ws, raw_data=None):
     """Build the Daily View tab from the last 14 days of Daily Raw Metrics.
 
     Reads raw metrics, computes an Activity Score for each learner-day
@@ -480,9 +614,12 @@ def write_daily_view(sheets, raw_ws):
     Args:
         sheets: SheetsClient instance.
         raw_ws: The Daily Raw Metrics worksheet object.
+        raw_data: Optional Daily Raw Metrics contents already read (e.g.
+            returned by sort_daily_raw_metrics); read from raw_ws if omitted.
     """
     print("\nWriting Daily View...")
-    all_data = raw_ws.get_all_values()
+    # Only Username through Lines Deleted (A..J) feed the view.
+    all_data = raw_data if raw_data is not None else raw_ws.get_all_values("A1:J")
     if len(all_data) <= 1:
         print("  No data in Daily Raw Metrics")
         return
@@ -503,10 +640,39 @@ def write_daily_view(sheets, raw_ws):
 
     cutoff = (datetime.now(timezone.utc) - timedelta(days=14)).strftime("%Y-%m-%d")
 
+    def safe_int(val):
+        """Convert a value to int, returning 0 on failure."""
+        try:
+            return int(float(val)) if val else 0
+        except (ValueError, TypeError):
+            return 0
+
+    def cell(row, idx):
+        """Read a numeric cell, treating missing trailing cells as 0."""
+        return safe_int(row[idx]) if len(row) > idx else 0
+
+    def view_metrics(row):
+        """Parse a raw row into the Daily View metric columns."""
+        commits = cell(row, commits_idx)
+        prs_o = cell(row, prs_opened_idx)
+        prs_m = cell(row, prs_merged_idx)
+        lines_a = cell(row, lines_added_idx)
+        lines_d = cell(row, lines_deleted_idx)
+        comments = cell(row, issue_comments_idx) + cell(row, review_comments_idx)
+        activity_score = min(10,
+            min(3, commits * 1)
+            + min(4, prs_o * 2)
+            + min(2, prs_m * 1)
+            + (1 if (lines_a + lines_d) > 0 else 0)
+        )
+        return [commits, prs_o, prs_m, lines_a, lines_d, comments, activity_score]
+
     learners_seen = set()
     dates_in_range = set()
     daily_data = {}
 
+    # Only in-range rows are parsed, and each exactly once; learner-days
+    # without a row share one zero-activity result.
     for row in rows:
         if len(row) <= date_idx:
             continue
@@ -517,51 +683,28 @@ def write_daily_view(sheets, raw_ws):
             dates_in_range.add(date_str)
             daily_data[(username, date_str)] = row
 
-    def safe_int(val):
-        """Convert a value to int, returning 0 on failure."""
-        try:
-            return int(float(val)) if val else 0
-        except (ValueError, TypeError):
-            return 0
+    parsed = {key: view_metrics(row) for key, row in daily_data.items()}
+    no_activity = [0, 0, 0, 0, 0, 0, 0]
 
     view_rows = []
+    sorted_learners = sorted(learners_seen, key=str.lower)
     for date_str in sorted(dates_in_range, reverse=True):
-        for username in sorted(learners_seen, key=str.lower):
-            row = daily_data.get((username, date_str))
-            if row:
-                commits = safe_int(row[commits_idx] if len(row) > commits_idx else 0)
-                prs_o = safe_int(row[prs_opened_idx] if len(row) > prs_opened_idx else 0)
-                prs_m = safe_int(row[prs_merged_idx] if len(row) > prs_merged_idx else 0)
-                lines_a = safe_int(row[lines_added_idx] if len(row) > lines_added_idx else 0)
-                lines_d = safe_int(row[lines_deleted_idx] if len(row) > lines_deleted_idx else 0)
-                comments = (
-                    safe_int(row[issue_comments_idx] if len(row) > issue_comments_idx else 0)
-                    + safe_int(row[review_comments_idx] if len(row) > review_comments_idx else 0)
-                )
-            else:
-                commits = prs_o = prs_m = lines_a = lines_d = comments = 0
-
-            activity_score = min(10,
-                min(3, commits * 1)
-                + min(4, prs_o * 2)
-                + min(2, prs_m * 1)
-                + (1 if (lines_a + lines_d) > 0 else 0)
-            )
+        for username in sorted_learners:
+            metrics = parsed.get((username, date_str), no_activity)
+            view_rows.append([date_str, username] + metrics)
 
-            view_rows.append([
-                date_str, username, commits, prs_o, prs_m,
-                lines_a, lines_d, comments, activity_score,
-            ])
-
-    view_rows.sort(key=lambda r: r[8], reverse=True)
-    view_rows.sort(key=lambda r: r[0], reverse=True)
+    view_rows.sort(key=lambda r: (r[0], r[8]), reverse=True)
 
     dv_ws = sheets.get_worksheet("Daily View")
     sheets.clear_and_write(dv_ws, DAILY_VIEW_HEADERS, view_rows)
     print(f"  Wrote {len(view_rows)} rows to Daily View")
 
 
-def write_alerts(sheets, leaderboard_rows, raw_ws, config):
+# Cell values that are known to be zero without parsing them.
+_ZERO_CELLS = frozenset(("", "0", "0.0"))
+
+
+def write_alerts(sheets, leaderboard_rows, raw_ws, config, raw_data=None):
     """Flag learners with inactivity, low scores, or declining trends.
 
     Reads Daily Raw Metrics for recent activity, cross-references
@@ -572,6 +715,8 @@ def write_alerts(sheets, leaderboard_rows, raw_ws, config):
         leaderboard_rows: List of leaderboard row dicts from update_leaderboard.
         raw_ws: The Daily Raw Metrics worksheet object.
         config: Config dict from the Config sheet.
+        raw_data: Optional Daily Raw Metrics contents already read; read
+            from raw_ws if omitted.
     """
     print("\nWriting Alerts...")
     inactive_days = int(config.get("inactive_threshold_days", 7))
@@ -579,7 +724,8 @@ def write_alerts(sheets, leaderboard_rows, raw_ws, config):
     declining_threshold = float(config.get("declining_score_threshold", 50))
     declining_min_days = int(config.get("declining_active_days_min", 2))
 
-    all_data = raw_ws.get_all_values()
+    # Only Username, Date and the activity columns (A..J) are consulted.
+    all_data = raw_data if raw_data is not None else raw_ws.get_all_values("A1:J")
     headers = all_data[0] if all_data else []
     rows = all_data[1:] if len(all_data) > 1 else []
 
@@ -619,7 +765,16 @@ def write_alerts(sheets, leaderboard_rows, raw_ws, config):
         username = row[username_idx]
         date_str = row[date_idx]
 
-        has_activity = any(safe_num(row[c]) > 0 for c in activity_cols if c < len(row))
+        # Rows older than both windows only matter if they would move the
+        # learner's last-active date forward.
+        if date_str < prev_week_cutoff and date_str <= user_last_active.get(username, ""):
+            continue
+
+        # Blank and zero cells are by far the most common; skip float() for them.
+        has_activity = any(
+            row[c] not in _ZERO_CELLS and safe_num(row[c]) > 0
+            for c in activity_cols if c < len(row)
+        )
 
         if has_activity:
             existing = user_last_active.get(username, "")
@@ -691,7 +846,7 @@ def write_summary(sheets, leaderboard_rows):
 
 
 def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
-                         weekly_rows=None, monthly_rows=None):
+                         weekly_rows=None, monthly_rows=None, raw_data=None):
     """Write scoring data to an external Google Sheet.
 
     For each group tab: normalizes to Name | Email | GitHub Username |
@@ -707,6 +862,8 @@ def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
         config: Config dict from the Config sheet.
         weekly_rows: Period leaderboard rows for the current week (Mon-Sun).
         monthly_rows: Period leaderboard rows for the current month.
+        raw_data: Optional Daily Raw Metrics contents already read; read
+            from raw_ws if omitted.
     """
     from tracker.config import detect_group_columns
 
@@ -729,7 +886,8 @@ def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
         metrics_lookup[r["username"].lower()] = r
 
     # Compute weekly commits and total issues from raw daily metrics
-    all_data = raw_ws.get_all_values()
+    # Only Username, Date, Commits and Issues Opened (A..F) are consulted.
+    all_data = raw_data if raw_data is not None else raw_ws.get_all_values("A1:F")
     raw_headers = all_data[0] if all_data else []
     raw_rows = all_data[1:] if len(all_data) > 1 else []
 
@@ -821,7 +979,7 @@ def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
 
             ws.clear()
             all_rows = [EXTERNAL_GROUP_HEADERS] + group_data
-            col_letter = chr(64 + len(EXTERNAL_GROUP_HEADERS))
+            col_letter = column_letter(len(EXTERNAL_GROUP_HEADERS))
             ws.update(values=all_rows, range_name=f"A1:{col_letter}{len(all_rows)}")
             print(f"  Wrote {len(group_data)} rows to {tab_name}")
         except Exception as e:
@@ -845,12 +1003,12 @@ def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
     try:
         gen_ws = ext_sp.worksheet("General Metrics Data")
         if gen_ws.row_count > 2:
-            col_letter = chr(64 + min(gen_ws.col_count, 26))
+            col_letter = column_letter(gen_ws.col_count)
             gen_ws.batch_clear([f"A2:{col_letter}{gen_ws.row_count}"])
-        col_letter = chr(64 + len(general_headers))
+        col_letter = column_letter(len(general_headers))
         gen_ws.update(values=[general_headers], range_name=f"A2:{col_letter}2")
         if general_rows:
-            col_letter = chr(64 + len(general_rows[0]))
+            col_letter = column_letter(len(general_rows[0]))
             gen_ws.update(values=general_rows, range_name=f"A3:{col_letter}{2 + len(general_rows)}")
         print(f"  Wrote {len(general_rows)} rows to General Metrics Data")
     except Exception as e:
@@ -878,12 +1036,12 @@ def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
     try:
         sum_ws = ext_sp.worksheet("Summarized Metrics for Reporting")
         if sum_ws.row_count > 2:
-            col_letter = chr(64 + min(sum_ws.col_count, 26))
+            col_letter = column_letter(sum_ws.col_count)
             sum_ws.batch_clear([f"A2:{col_letter}{sum_ws.row_count}"])
-        col_letter = chr(64 + len(summary_headers))
+        col_letter = column_letter(len(summary_headers))
         sum_ws.update(values=[summary_headers], range_name=f"A2:{col_letter}2")
         if summary_rows:
-            col_letter = chr(64 + len(summary_rows[0]))
+            col_letter = column_letter(len(summary_rows[0]))
             sum_ws.update(values=summary_rows, range_name=f"A3:{col_letter}{2 + len(summary_rows)}")
         print(f"  Wrote {len(summary_rows)} rows to Summarized Metrics for Reporting")
     except Exception as e:
@@ -909,7 +1067,7 @@ def write_external_sheet(sheets, leaderboard_rows, raw_ws, config,
                 pw = ext_sp.add_worksheet(title=tab_title, rows=200, cols=len(EXTERNAL_PERIOD_HEADERS))
             pw.clear()
             all_rows = [EXTERNAL_PERIOD_HEADERS] + data
-            col_letter = chr(64 + len(EXTERNAL_PERIOD_HEADERS))
+            col_letter = column_letter(len(EXTERNAL_PERIOD_HEADERS))
             pw.update(values=all_rows, range_name=f"A1:{col_letter}{len(all_rows)}")
             print(f"  Wrote {len(data)} rows to {tab_title}")
         except Exception as e: